@@ -0,0 +1,51 @@
+"""
+Shared settings for the standalone API scripts (explore_api.py, test_bookings.py).
+
+The environment is read once here, so the scripts cannot drift apart. The MCP
+server reads its own settings because it ships as a single file.
+"""
+
+import os
+
+import httpx
+from dotenv import load_dotenv
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# httpx only negotiates HTTP/2 when the h2 package is installed
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+load_dotenv()
+
+API_BASE_URL = os.getenv("ELABFTW_API_URL", "https://your-server.example.com/api/v2")
+API_KEY = os.getenv("ELABFTW_API_KEY", "")
+VERIFY_SSL = os.getenv("ELABFTW_VERIFY_SSL", "false").lower() == "true"
+# Requests kept in flight at once, to stay clear of the server's rate limiting
+MAX_CONCURRENCY = max(1, int(os.getenv("ELABFTW_MAX_CONCURRENCY", "8")))
+
+HEADERS = {
+    "Authorization": API_KEY,
+    "Content-Type": "application/json",
+}
+
+
+def make_client() -> httpx.Client:
+    """Create the httpx client the scripts share for all of their requests."""
+    return httpx.Client(
+        headers=HEADERS, verify=VERIFY_SSL, timeout=30.0, http2=HTTP2_AVAILABLE
+    )
+
+
+def load_json(response: httpx.Response):
+    """Parse a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
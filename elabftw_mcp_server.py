@@ -2,10 +2,13 @@
 # /// script
 # requires-python = ">=3.10"
 # dependencies = [
-#     "mcp>=1.0.0",
-#     "httpx>=0.25.0",
+#     "mcp>=1.10.0",
+#     "httpx[brotli,http2,zstd]>=0.27.1",
 #     "anyio>=4.0.0",
+#     "jsonschema>=4.20.0",
 #     "python-dotenv>=1.0.0",
+#     "orjson>=3.9.0",
+#     "uvloop>=0.19.0; sys_platform != 'win32'",
 # ]
 # ///
 """
@@ -24,11 +27,23 @@ Usage:
     Or configure in Claude Desktop / Ollama MCP settings
 """
 
+import hashlib
 import json
 import logging
 import os
-from datetime import datetime
-from typing import Any, Optional
+import random
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, wraps
+from operator import itemgetter
+from typing import Any, Callable, Final, Optional
+from urllib.parse import quote
 
 # Load environment variables from .env file if present
 try:
@@ -38,7 +53,31 @@ try:
 except ImportError:
     pass  # python-dotenv not installed, use environment variables directly
 
+# orjson parses and serializes JSON several times faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None  # fall back to the json module
+
+# httpx only negotiates HTTP/2 when the h2 package is installed
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# uvloop is a faster drop-in event loop (not available on Windows)
+try:
+    import uvloop  # noqa: F401
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+import anyio
 import httpx
+import jsonschema
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
@@ -63,8 +102,33 @@ API_KEY = os.getenv("ELABFTW_API_KEY", "")
 # For production, you should use proper certificates and set this to True
 VERIFY_SSL = os.getenv("ELABFTW_VERIFY_SSL", "false").lower() == "true"
 
+# Log full tracebacks for unexpected tool errors; off by default because
+# formatting them on every failure is costly when the server is down
+DEBUG_TRACEBACKS = os.getenv("ELABFTW_DEBUG_TB", "false").lower() in ("1", "true")
+
+# Templates, categories and item types are kept on disk for an hour so they
+# survive server restarts; set ELABFTW_CACHE_DIR to an empty string to disable
+CACHE_DIR = os.getenv(
+    "ELABFTW_CACHE_DIR",
+    os.path.join(
+        os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "elabftw-mcp"
+    ),
+)
+DISK_CACHE_TTL = 3600
+# Seconds the same listings are served from memory before asking the server
+LOOKUP_CACHE_TTL = max(0, int(os.getenv("ELABFTW_LOOKUP_TTL", "300")))
+
+# Upper bound on requests the client keeps in flight across all tool calls and
+# fan-outs (bulk bookings, item details, tags), to stay clear of the server's
+# rate limiting
+MAX_CONCURRENCY = max(1, int(os.getenv("ELABFTW_MAX_CONCURRENCY", "8")))
+# Idle connections kept open to the server; each costs a socket plus a few KB
+# of TLS state, so keep it near the fan-out rather than much larger
+POOL_SIZE = max(MAX_CONCURRENCY, int(os.getenv("ELABFTW_POOL_SIZE", "20")))
+DISK_CACHE_SCHEMA_VERSION = 1
+
 # Lab Prompt: the content the LLM uses as its guidance for eLabFTW interactions
-LAB_PROMPT = """
+LAB_PROMPT: Final[str] = """
 You are an AI lab assistant integrated with an eLabFTW notebook and its resources (files, datasets, instruments, protocols, wiki). Your goals are to: find, summarize, cross‑reference, and transform information in eLabFTW; draft well‑structured experiments, protocols, summaries, and reports in the user's style; and reason over experiments, items, tags, and attachments.
 
 Always behave as a domain‑aware assistant for an experimental soft‑matter/biophysics group, using precise technical language and concise answers. If information in eLabFTW is missing or ambiguous, say what is missing, never invent IDs or results, and suggest which search, tag, or experiment could resolve it.
@@ -84,28 +148,504 @@ Keep answers compact and technically dense, avoiding generic commentary. For saf
 If a request is under‑specified, ask targeted clarification (project/tag, date range, instrument, status such as approved vs draft) and prefer stepwise, interactive refinement over a single large answer.
 
 You are now connected to eLabFTW via an MCP server that can query experiments, items, and wiki pages by IDs, titles, tags, and date ranges, access attachments, and return markdown content for entries.
-"""
+""".strip()
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """
+    Serialize tool output as JSON.
+
+    Output is compact by default since every whitespace character costs the
+    model tokens; pretty indents it by two spaces for human readers.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Trailing numeric id of a Location header such as ".../experiments/42"
+_LOCATION_ID_RE = re.compile(r"/(\d+)/?$")
+
+
+def _parse_new_id(response: httpx.Response) -> Optional[int]:
+    """Return the id of a created resource from its Location header, if any."""
+    match = _LOCATION_ID_RE.search(response.headers.get("location", ""))
+    return int(match.group(1)) if match else None
+
+
+def _build_params(**params: Any) -> dict[str, Any]:
+    """Build query parameters, leaving out the ones that are None."""
+    return {key: value for key, value in params.items() if value is not None}
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    """Serialize a request body as compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_body(response: httpx.Response) -> Optional[dict[str, Any]]:
+    """Return the JSON object in a response body, or None if there is none."""
+    if not response.content or "json" not in response.headers.get("content-type", ""):
+        return None
+    body = _loads(response.content)
+    return body if isinstance(body, dict) and body else None
+
+
+def _match_entry(
+    entries: list[dict[str, Any]], hint: str
+) -> Optional[dict[str, Any]]:
+    """
+    Pick the template/category an ID or title hint refers to.
+
+    A numeric hint matches the ID; otherwise an exact (case-insensitive)
+    title match wins over the first title containing the hint.
+    """
+    hint = hint.strip()
+    if hint.isdigit():
+        return next((e for e in entries if str(e.get("id")) == hint), None)
+    needle = hint.casefold()
+    titles = [(str(e.get("title") or "").casefold(), e) for e in entries]
+    return next((e for title, e in titles if title == needle), None) or next(
+        (e for title, e in titles if needle in title), None
+    )
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response stream that calls release once, when it is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
+
+
+class _RetryTransport(httpx.BaseTransport):
+    """
+    Transport that retries rate-limited and transient server errors.
+
+    429 responses are always retried since the server did not process the
+    request; 5xx responses are retried only for idempotent methods so a
+    create is never sent twice (PATCH counts as idempotent here, since every
+    PATCH in this client sets fields to absolute values). A Retry-After
+    header is honored (capped), otherwise the delay backs off exponentially
+    with up to 50% random jitter so parallel requests do not retry in step.
+    Connection failures are retried by the wrapped HTTPTransport.
+
+    With a limiter, every attempt holds one of its slots from sending the
+    request until the response is closed, so the requests of all threads
+    sharing the client together never exceed its bound.
+    """
+
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"}
+    )
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        retries: int = 3,
+        backoff_factor: float = 0.3,
+        max_delay: float = 30.0,
+        limiter: Optional[threading.BoundedSemaphore] = None,
+    ):
+        self._transport = transport
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self._limiter = limiter
+
+    def _should_retry(self, request: httpx.Request, response: httpx.Response) -> bool:
+        if response.status_code == 429:
+            return True
+        return (
+            response.status_code in self.RETRY_STATUSES
+            and request.method in self.IDEMPOTENT_METHODS
+        )
+
+    def _delay(self, response: httpx.Response, attempt: int) -> float:
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    when = parsedate_to_datetime(retry_after)
+                except (TypeError, ValueError):
+                    when = None
+                if when is not None and when.tzinfo is None:
+                    # "-0000" dates parse as naive; HTTP dates are always UTC
+                    when = when.replace(tzinfo=timezone.utc)
+                delay = (
+                    (when - datetime.now(timezone.utc)).total_seconds() if when else 0.0
+                )
+            return min(max(delay, 0.0), self.max_delay)
+        delay = self.backoff_factor * (2**attempt)
+        return min(delay + random.uniform(0, 0.5) * delay, self.max_delay)
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send one attempt, holding a limiter slot until the response closes."""
+        if self._limiter is None:
+            return self._transport.handle_request(request)
+        self._limiter.acquire()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            self._limiter.release()
+            raise
+        response.stream = _ReleasingStream(response.stream, self._limiter.release)
+        return response
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self.retries):
+            response = self._send(request)
+            if not self._should_retry(request, response):
+                return response
+            delay = self._delay(response, attempt)
+            response.close()
+            logger.warning(
+                f"{request.method} {request.url.path} returned "
+                f"{response.status_code}, retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+        return self._send(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _TTLCache:
+    """Small thread-safe mapping whose entries expire after ttl seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[Any, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._data[key]
+                return None
+            return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                # Dicts keep insertion order, so this drops the oldest entry
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
 
 
 class ElabFTWClient:
     """Client for interacting with elabFTW API."""
 
+    _ETAG_CACHE_SIZE = 256
+    # Booking writes send pre-encoded JSON and ask for the resource back
+    _BOOKING_WRITE_HEADERS = {
+        "Content-Type": "application/json",
+        "Prefer": "return=representation",
+    }
+    # Large uploads can take minutes to send; don't time out between writes
+    _UPLOAD_TIMEOUT = httpx.Timeout(30.0, read=300.0, write=None)
+    # The API returns at most 100 rows per page; scans over several pages
+    # (bookable items, event cursors) stop after this many to bound the cost,
+    # even if the server keeps returning full pages
+    _PAGE_SIZE = 100
+    _MAX_SCAN_PAGES = 20
+
     def __init__(self, base_url: str, api_key: str, verify_ssl: bool = True):
         self.base_url = base_url.rstrip("/")
+        # Attachment download links live on the web app, not under /api/v2
+        self._download_url = (
+            self.base_url.replace("/api/v2", "")
+            + "/app/download.php?f={long_name}&name={real_name}"
+        )
         self.api_key = api_key
         self.verify_ssl = verify_ssl
+        # Content-Type is left to httpx so that multipart uploads are not
+        # sent as application/json; json= bodies get it set automatically
         self.headers = {
             "Authorization": api_key,
-            "Content-Type": "application/json",
         }
-
-    def _get_client(self) -> httpx.Client:
-        """Create an HTTP client with proper configuration."""
-        return httpx.Client(
-            headers=self.headers,
+        # Long-lived client so keep-alive connections are reused across calls
+        # instead of paying a new TCP + TLS handshake per request. httpx sends
+        # Accept-Encoding for every decoder it has (gzip, deflate, plus br and
+        # zstd with the brotli and zstandard packages) and decompresses
+        # responses transparently.
+        # Rate-limited (429) and transient 5xx responses are retried on the
+        # same pooled connections; connection failures are retried too. With
+        # h2 installed, concurrent requests are multiplexed over HTTP/2.
+        transport = httpx.HTTPTransport(
             verify=self.verify_ssl,
+            http2=HTTP2_AVAILABLE,
+            retries=3,
+            # Tool calls arrive seconds apart, so idle connections are kept
+            # for a minute; that stays below nginx's default 75 s keepalive
+            # timeout, after which the server would drop them anyway
+            limits=httpx.Limits(
+                max_keepalive_connections=POOL_SIZE,
+                max_connections=POOL_SIZE * 2,
+                keepalive_expiry=60.0,
+            ),
+        )
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            headers=self.headers,
             timeout=30.0,
+            transport=_RetryTransport(
+                transport, limiter=threading.BoundedSemaphore(MAX_CONCURRENCY)
+            ),
+        )
+        # (path, params) -> (validator headers, parsed body) for conditional
+        # GETs; least recently used entries go beyond _ETAG_CACHE_SIZE
+        self._etag_cache: OrderedDict[
+            tuple[str, frozenset], tuple[dict[str, str], Any]
+        ] = OrderedDict()
+        self._etag_lock = threading.Lock()
+        # item id -> item; short-lived since items are edited in the web UI too
+        self._item_cache = _TTLCache(maxsize=256, ttl=15)
+        # item id -> item details for the bookable-items listing, whose
+        # booking settings rarely change within a session
+        self._bookable_cache = _TTLCache(maxsize=2048, ttl=300)
+        # list_events arguments -> events, for repeated queries within a turn
+        self._events_cache = _TTLCache(maxsize=256, ttl=10)
+        # event id -> event
+        self._event_cache = _TTLCache(maxsize=256, ttl=30)
+        # experiment id -> experiment; short-lived since experiments are edited
+        self._experiment_cache = _TTLCache(maxsize=256, ttl=15)
+        # (path, params) -> templates / categories / item types, which rarely change
+        self._lookup_cache = _TTLCache(maxsize=128, ttl=LOOKUP_CACHE_TTL)
+        # Lookup keys already tried against the disk cache since startup
+        self._disk_checked: set[tuple] = set()
+        # (path, params) -> experiment / item list page, for paging back and
+        # forth through the same listing; cleared by any experiment/item write
+        self._list_cache = _TTLCache(maxsize=32, ttl=30)
+
+    def close(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        self._client.close()
+
+    def __enter__(self) -> "ElabFTWClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        client = getattr(self, "_client", None)
+        if client is not None:
+            client.close()
+
+    def _run_concurrently(self, fn, args: list) -> list:
+        """
+        Call fn once per argument in a thread pool, preserving order.
+
+        The transport's limiter caps the requests in flight across all
+        threads at MAX_CONCURRENCY, so extra workers only wait for a slot.
+        """
+        if not args:
+            return []
+        workers = min(MAX_CONCURRENCY, len(args))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, args))
+
+    def _add_tags(self, path: str, tags: list[str]) -> dict[str, str]:
+        """
+        POST each tag to a tags endpoint concurrently.
+
+        A 409 Conflict means the tag is already attached and is not an error.
+        Any other failure (transient ones have already been retried by the
+        transport) is logged and reported back as {tag: reason}, so the caller
+        can surface it without failing an entry that was already created.
+        """
+        responses = self._run_concurrently(
+            lambda tag: self._client.post(path, json={"tag": tag}), tags
+        )
+        errors = {}
+        for tag, response in zip(tags, responses):
+            if response.is_success or response.status_code == 409:
+                continue
+            reason = f"HTTP {response.status_code}: {response.text[:200]}"
+            logger.warning(f"Adding tag {tag!r} via {path} failed: {reason}")
+            errors[tag] = reason
+        return errors
+
+    def _get_list(self, path: str, params: dict[str, Any]) -> Any:
+        """GET an experiment or item listing, serving repeats from the list cache."""
+        key = (path, frozenset(params.items()))
+        cached = self._list_cache.get(key)
+        if cached is None:
+            cached = self._cached_get(path, params)
+            self._list_cache.set(key, cached)
+        return cached
+
+    def _forget_experiment(self, experiment_id: int) -> None:
+        """Drop cached data that a change to an experiment makes stale."""
+        self._experiment_cache.pop(experiment_id)
+        self._list_cache.clear()
+
+    def _forget_item(self, item_id: int) -> None:
+        """Drop cached data that a change to an item makes stale."""
+        self._item_cache.pop(item_id)
+        self._bookable_cache.pop(item_id)
+        self._list_cache.clear()
+
+    def _get_lookup(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        refresh: bool = False,
+    ) -> Any:
+        """
+        GET a rarely changing listing, serving repeats from the lookup cache.
+
+        The first miss for a key after startup falls back to the on-disk
+        cache before going to the server, so a restarted server does not
+        refetch it. Later misses mean the in-memory copy expired and go to the
+        server, so nothing is served older than LOOKUP_CACHE_TTL after that.
+        With refresh, both caches are bypassed and then updated.
+        """
+        key = (path, frozenset((params or {}).items()))
+        cached = None if refresh else self._lookup_cache.get(key)
+        if cached is not None:
+            return cached
+        disk_path = self._disk_cache_path(path, params)
+        result = None
+        if not refresh and key not in self._disk_checked:
+            self._disk_checked.add(key)
+            result = self._read_disk_cache(disk_path)
+        if result is None:
+            result = self._cached_get(path, params)
+            self._write_disk_cache(disk_path, result)
+        self._lookup_cache.set(key, result)
+        return result
+
+    def _disk_cache_path(
+        self, path: str, params: Optional[dict[str, Any]]
+    ) -> Optional[str]:
+        """File for a lookup in the disk cache, or None if it is disabled."""
+        if not CACHE_DIR:
+            return None
+        # The API key is part of the key: listings are scoped to the user's team
+        ident = repr(
+            (self.base_url, self.api_key, path, sorted((params or {}).items()))
+        )
+        name = hashlib.sha256(ident.encode()).hexdigest()
+        return os.path.join(CACHE_DIR, f"{name}.json")
+
+    def _read_disk_cache(self, disk_path: Optional[str]) -> Any:
+        """Return a fresh disk cache entry's data, or None."""
+        if disk_path is None:
+            return None
+        try:
+            with open(disk_path, "rb") as f:
+                entry = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("schema_version") != DISK_CACHE_SCHEMA_VERSION
+            or entry.get("api_url") != self.base_url
+            or time.time() - entry.get("cached_at", 0) > DISK_CACHE_TTL
+        ):
+            return None
+        return entry.get("data")
+
+    def _write_disk_cache(self, disk_path: Optional[str], data: Any) -> None:
+        """Store data in the disk cache; failures only cost the cache."""
+        if disk_path is None:
+            return
+        entry = {
+            "cached_at": time.time(),
+            "api_url": self.base_url,
+            "schema_version": DISK_CACHE_SCHEMA_VERSION,
+            "data": data,
+        }
+        tmp_path = None
+        try:
+            os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+            # A private temp file per write, so concurrent writers of the same
+            # key never interleave before the atomic replace
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(_dumps(entry))
+            os.replace(tmp_path, disk_path)
+        except OSError as e:
+            logger.debug(f"Could not write disk cache {disk_path}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _cached_get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
+        """
+        GET a path, revalidating a previously seen response with the server.
+
+        If an earlier response carried an ETag or Last-Modified header, it is
+        sent back as If-None-Match / If-Modified-Since; on 304 Not Modified the
+        cached body is returned instead of downloading it again.
+        """
+        key = (path, frozenset((params or {}).items()))
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+            if cached:
+                self._etag_cache.move_to_end(key)
+        response = self._client.get(
+            path, params=params, headers=cached[0] if cached else None
         )
+        if cached and response.status_code == 304:
+            return cached[1]
+        response.raise_for_status()
+        body = _loads(response.content)
+
+        validators = {}
+        if "etag" in response.headers:
+            validators["If-None-Match"] = response.headers["etag"]
+        if "last-modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["last-modified"]
+        if validators:
+            with self._etag_lock:
+                self._etag_cache[key] = (validators, body)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > self._ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return body
 
     def list_experiments(
         self,
@@ -126,19 +666,9 @@ class ElabFTWClient:
         Returns:
             Dictionary containing list of experiments
         """
-        params = {"limit": limit, "offset": offset}
-        if search:
-            params["q"] = search
-        if owner:
-            params["owner"] = owner
-
-        with self._get_client() as client:
-            response = client.get(
-                f"{self.base_url}/experiments",
-                params=params,
-            )
-            response.raise_for_status()
-            return response.json()
+        params = _build_params(limit=limit, offset=offset, q=search, owner=owner)
+
+        return self._get_list("/experiments", params)
 
     def get_experiment(self, experiment_id: int) -> dict[str, Any]:
         """
@@ -150,10 +680,12 @@ class ElabFTWClient:
         Returns:
             Dictionary containing experiment details
         """
-        with self._get_client() as client:
-            response = client.get(f"{self.base_url}/experiments/{experiment_id}")
-            response.raise_for_status()
-            return response.json()
+        cached = self._experiment_cache.get(experiment_id)
+        if cached is not None:
+            return cached
+        experiment = self._cached_get(f"/experiments/{experiment_id}")
+        self._experiment_cache.set(experiment_id, experiment)
+        return experiment
 
     def create_experiment(
         self,
@@ -178,38 +710,53 @@ class ElabFTWClient:
             Dictionary containing the created experiment info
         """
         # Create the experiment with all parameters in JSON body per API spec
-        with self._get_client() as client:
-            # Build the JSON body for POST request
-            create_data: dict[str, Any] = {
-                "title": title,
-                "body": body,
-            }
-            if template is not None:
-                create_data["template"] = template
-            if category is not None:
-                create_data["category"] = category
-
-            response = client.post(
-                f"{self.base_url}/experiments",
-                json=create_data,
-            )
-            response.raise_for_status()
+        # Build the JSON body for POST request
+        create_data: dict[str, Any] = {
+            "title": title,
+            "body": body,
+        }
+        if template is not None:
+            create_data["template"] = template
+        if category is not None:
+            create_data["category"] = category
 
-            # Get the location header which contains the new experiment URL
-            location = response.headers.get("location", "")
-            # Extract the experiment ID from the location
-            experiment_id = int(location.split("/")[-1])
+        response = self._client.post(
+            "/experiments",
+            json=create_data,
+        )
+        response.raise_for_status()
+        self._list_cache.clear()
+
+        # The Location header holds the new experiment URL
+        location = response.headers.get("location", "")
+        experiment_id = _parse_new_id(response)
+        if experiment_id is None:
+            raise ValueError(
+                f"Could not determine created experiment ID from Location: {location!r}"
+            )
 
-            # Add tags if provided
-            if tags:
-                for tag in tags:
-                    client.post(
-                        f"{self.base_url}/experiments/{experiment_id}/tags",
-                        json={"tag": tag},
-                    )
+        # Add tags if provided
+        tag_errors = {}
+        if tags:
+            tag_errors = self._add_tags(f"/experiments/{experiment_id}/tags", tags)
+            self._forget_experiment(experiment_id)
 
-            # Return the created experiment
-            return self.get_experiment(experiment_id)
+        if template is not None:
+            # The server fills the body (and possibly more) from the template,
+            # so the request no longer describes what was created
+            result = self.get_experiment(experiment_id)
+        else:
+            # The server only sends back a Location header; describe the new
+            # experiment from the request instead of spending a GET on it
+            result = {
+                "id": experiment_id,
+                **create_data,
+                "tags": [tag for tag in tags or [] if tag not in tag_errors],
+                "url": location,
+            }
+        if tag_errors:
+            result = {**result, "tag_errors": tag_errors}
+        return result
 
     def update_experiment(
         self,
@@ -248,13 +795,25 @@ class ElabFTWClient:
         if not update_data:
             raise ValueError("At least one field must be provided for update")
 
-        with self._get_client() as client:
-            response = client.patch(
-                f"{self.base_url}/experiments/{experiment_id}",
-                json=update_data,
-            )
-            response.raise_for_status()
-            return self.get_experiment(experiment_id)
+        response = self._client.patch(
+            f"/experiments/{experiment_id}",
+            json=update_data,
+        )
+        response.raise_for_status()
+        self._forget_experiment(experiment_id)
+        return self._patched_experiment(response, experiment_id, update_data)
+
+    def _patched_experiment(
+        self,
+        response: httpx.Response,
+        experiment_id: int,
+        update_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Result of an experiment PATCH, without a follow-up GET."""
+        body = _json_body(response)
+        if body is not None:
+            return body
+        return {"id": experiment_id, **update_data}
 
     def add_tag_to_experiment(self, experiment_id: int, tag: str) -> dict[str, Any]:
         """
@@ -267,16 +826,16 @@ class ElabFTWClient:
         Returns:
             Success message
         """
-        with self._get_client() as client:
-            response = client.post(
-                f"{self.base_url}/experiments/{experiment_id}/tags",
-                json={"tag": tag},
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Tag '{tag}' added to experiment {experiment_id}",
-            }
+        response = self._client.post(
+            f"/experiments/{experiment_id}/tags",
+            json={"tag": tag},
+        )
+        response.raise_for_status()
+        self._forget_experiment(experiment_id)
+        return {
+            "status": "success",
+            "message": f"Tag '{tag}' added to experiment {experiment_id}",
+        }
 
     def remove_tag_from_experiment(
         self, experiment_id: int, tag_id: int
@@ -291,15 +850,15 @@ class ElabFTWClient:
         Returns:
             Success message
         """
-        with self._get_client() as client:
-            response = client.delete(
-                f"{self.base_url}/experiments/{experiment_id}/tags/{tag_id}",
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Tag {tag_id} removed from experiment {experiment_id}",
-            }
+        response = self._client.delete(
+            f"/experiments/{experiment_id}/tags/{tag_id}",
+        )
+        response.raise_for_status()
+        self._forget_experiment(experiment_id)
+        return {
+            "status": "success",
+            "message": f"Tag {tag_id} removed from experiment {experiment_id}",
+        }
 
     def set_experiment_status(
         self,
@@ -316,13 +875,13 @@ class ElabFTWClient:
         Returns:
             Dictionary containing the updated experiment info
         """
-        with self._get_client() as client:
-            response = client.patch(
-                f"{self.base_url}/experiments/{experiment_id}",
-                json={"status": status_id},
-            )
-            response.raise_for_status()
-            return self.get_experiment(experiment_id)
+        response = self._client.patch(
+            f"/experiments/{experiment_id}",
+            json={"status": status_id},
+        )
+        response.raise_for_status()
+        self._forget_experiment(experiment_id)
+        return self._patched_experiment(response, experiment_id, {"status": status_id})
 
     def link_item_to_experiment(
         self,
@@ -344,15 +903,15 @@ class ElabFTWClient:
         if link_type not in ("experiments", "items"):
             raise ValueError("link_type must be 'experiments' or 'items'")
 
-        with self._get_client() as client:
-            response = client.post(
-                f"{self.base_url}/experiments/{experiment_id}/{link_type}_links/{link_id}",
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Linked {link_type[:-1]} {link_id} to experiment {experiment_id}",
-            }
+        response = self._client.post(
+            f"/experiments/{experiment_id}/{link_type}_links/{link_id}",
+        )
+        response.raise_for_status()
+        self._forget_experiment(experiment_id)
+        return {
+            "status": "success",
+            "message": f"Linked {link_type[:-1]} {link_id} to experiment {experiment_id}",
+        }
 
     def upload_attachment(
         self,
@@ -371,36 +930,37 @@ class ElabFTWClient:
         Returns:
             Dictionary with upload result
         """
-        import os
-
-        if not os.path.exists(file_path):
+        if not os.path.isfile(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
-
-        with self._get_client() as client:
-            with open(file_path, "rb") as f:
-                files = {"file": (os.path.basename(file_path), f)}
-                data = {}
-                if comment:
-                    data["comment"] = comment
-
-                # Need to remove Content-Type header for multipart upload
-                headers = {"Authorization": self.api_key}
-                response = client.post(
-                    f"{self.base_url}/experiments/{experiment_id}/uploads",
-                    files=files,
-                    data=data,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                return {
-                    "status": "success",
-                    "message": f"File '{os.path.basename(file_path)}' uploaded to experiment {experiment_id}",
-                }
+        size = os.stat(file_path).st_size
+
+        # httpx streams the open file into the multipart body chunk by chunk,
+        # so memory use does not grow with the file size
+        with open(file_path, "rb") as f:
+            files = {"file": (os.path.basename(file_path), f)}
+            data = {}
+            if comment:
+                data["comment"] = comment
+
+            response = self._client.post(
+                f"/experiments/{experiment_id}/uploads",
+                files=files,
+                data=data,
+                timeout=self._UPLOAD_TIMEOUT,
+            )
+            response.raise_for_status()
+            self._forget_experiment(experiment_id)
+            return {
+                "status": "success",
+                "message": f"File '{os.path.basename(file_path)}' uploaded to experiment {experiment_id}",
+                "size_bytes": size,
+            }
 
     def list_experiment_templates(
         self,
         limit: int = 15,
         offset: int = 0,
+        refresh: bool = False,
     ) -> list[dict[str, Any]]:
         """
         List available experiment templates.
@@ -411,23 +971,19 @@ class ElabFTWClient:
         Args:
             limit: Maximum number of templates to return (default: 15)
             offset: Number of templates to skip (for pagination)
+            refresh: Bypass the cached listing and read it from the server
 
         Returns:
             List of available experiment templates
         """
         params = {"limit": limit, "offset": offset}
 
-        with self._get_client() as client:
-            response = client.get(
-                f"{self.base_url}/experiments_templates",
-                params=params,
-            )
-            response.raise_for_status()
-            return response.json()
+        return self._get_lookup("/experiments_templates", params, refresh)
 
     def list_experiment_categories(
         self,
         team_id: int = 1,
+        refresh: bool = False,
     ) -> list[dict[str, Any]]:
         """
         List available experiment categories for a team.
@@ -437,16 +993,132 @@ class ElabFTWClient:
 
         Args:
             team_id: The team ID to get categories for (default: 1)
+            refresh: Bypass the cached listing and read it from the server
 
         Returns:
             List of experiment categories with id, title, and color
         """
-        with self._get_client() as client:
-            response = client.get(
-                f"{self.base_url}/teams/{team_id}/experiments_categories",
+        return self._get_lookup(
+            f"/teams/{team_id}/experiments_categories", refresh=refresh
+        )
+
+    def _list_all_templates(self, refresh: bool = False) -> list[dict[str, Any]]:
+        """
+        Read the experiment templates, one full page at a time.
+
+        Stops after _MAX_SCAN_PAGES pages, so at most 2000 templates are
+        returned even if the server keeps sending full pages.
+        """
+        templates: list[dict[str, Any]] = []
+        offset = 0
+        for _ in range(self._MAX_SCAN_PAGES):
+            page = self.list_experiment_templates(
+                limit=self._PAGE_SIZE, offset=offset, refresh=refresh
             )
-            response.raise_for_status()
-            return response.json()
+            templates.extend(page)
+            if len(page) < self._PAGE_SIZE:
+                break
+            offset += len(page)
+        return templates
+
+    def create_experiment_guided(
+        self,
+        title: str,
+        template_hint: Optional[str] = None,
+        category_hint: Optional[str] = None,
+        body: str = "",
+        tags: Optional[list[str]] = None,
+        team_id: int = 1,
+    ) -> dict[str, Any]:
+        """
+        Create an experiment after resolving its template and category.
+
+        The templates (up to 2000) and the team's categories are fetched
+        concurrently, the hints are matched against them (see _match_entry)
+        and the experiment is created, so the whole create-experiment-guide
+        workflow is one tool call. A hint that matches nothing in a cached
+        listing is retried once against a fresh one, so entries just created
+        in the web UI are found.
+
+        Args:
+            title: Title of the experiment
+            template_hint: Template ID or (part of a) template title
+            category_hint: Category ID or (part of a) category title
+            body: Body/content of the experiment (HTML supported)
+            tags: Optional list of tags
+            team_id: The team whose categories are searched (default: 1)
+
+        Returns:
+            Dictionary with the available templates and categories (id and
+            title) and the created experiment
+
+        Raises:
+            ValueError: If a hint matches no template or category
+        """
+        templates, categories = self._run_concurrently(
+            lambda load: load(),
+            [
+                self._list_all_templates,
+                lambda: self.list_experiment_categories(team_id),
+            ],
+        )
+
+        scan_limit = self._MAX_SCAN_PAGES * self._PAGE_SIZE
+
+        def resolve(
+            kind: str,
+            entries: list[dict[str, Any]],
+            hint: Optional[str],
+            refetch: Callable[[], list[dict[str, Any]]],
+        ) -> tuple[Optional[int], list[dict[str, Any]]]:
+            if not hint:
+                return None, entries
+            entry = _match_entry(entries, hint)
+            if entry is None:
+                entries = refetch()
+                entry = _match_entry(entries, hint)
+            if entry is None:
+                available = ", ".join(
+                    f"{e.get('id')}: {e.get('title')}" for e in entries
+                )
+                incomplete = (
+                    f" (only the first {len(entries)} were searched; the list"
+                    f" may be incomplete, so try the {kind} ID)"
+                    if len(entries) >= scan_limit
+                    else ""
+                )
+                raise ValueError(
+                    f"No {kind} matches {hint!r}{incomplete}. "
+                    f"Available: {available or 'none'}"
+                )
+            return entry["id"], entries
+
+        template, templates = resolve(
+            "template",
+            templates,
+            template_hint,
+            lambda: self._list_all_templates(refresh=True),
+        )
+        category, categories = resolve(
+            "category",
+            categories,
+            category_hint,
+            lambda: self.list_experiment_categories(team_id, refresh=True),
+        )
+        created = self.create_experiment(
+            title=title,
+            body=body,
+            template=template,
+            category=category,
+            tags=tags,
+        )
+        return {
+            "templates": [{"id": t.get("id"), "title": t.get("title")} for t in templates],
+            "categories": [
+                {"id": c.get("id"), "title": c.get("title")} for c in categories
+            ],
+            "created": created,
+        }
 
     def delete_experiment(self, experiment_id: int) -> dict[str, Any]:
         """
@@ -461,15 +1133,15 @@ class ElabFTWClient:
         Returns:
             Success message
         """
-        with self._get_client() as client:
-            response = client.delete(
-                f"{self.base_url}/experiments/{experiment_id}",
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Experiment {experiment_id} has been deleted",
-            }
+        response = self._client.delete(
+            f"/experiments/{experiment_id}",
+        )
+        response.raise_for_status()
+        self._forget_experiment(experiment_id)
+        return {
+            "status": "success",
+            "message": f"Experiment {experiment_id} has been deleted",
+        }
 
     # ==================== ITEMS/RESOURCES METHODS ====================
 
@@ -497,36 +1169,81 @@ class ElabFTWClient:
         Returns:
             List of items
         """
-        params = {"limit": limit, "offset": offset}
-        if search:
-            params["q"] = search
-        if category is not None:
-            params["cat"] = category
-        if owner:
-            params["owner"] = owner
-
-        with self._get_client() as client:
-            response = client.get(
-                f"{self.base_url}/items",
-                params=params,
-            )
-            response.raise_for_status()
-            return response.json()
+        params = _build_params(
+            limit=limit, offset=offset, q=search, cat=category, owner=owner
+        )
+
+        return self._get_list("/items", params)
+
+    def list_bookable_items(self, limit: int = 50) -> list[dict[str, Any]]:
+        """
+        List database items that can be booked.
+
+        The API has no filter for bookable items, so items are read a page at
+        a time and filtered here until 'limit' bookable items are found, the
+        list runs out, or the first 2000 items have been scanned; 'limit'
+        counts bookable items, not items scanned.
+
+        Args:
+            limit: Maximum number of bookable items to return (default: 50)
+
+        Returns:
+            List of bookable items
+        """
+        bookable: list[dict[str, Any]] = []
+        offset = 0
+        for _ in range(self._MAX_SCAN_PAGES):
+            page = self.list_items(limit=self._PAGE_SIZE, offset=offset)
+            bookable.extend(item for item in page if item.get("is_bookable") == 1)
+            if len(bookable) >= limit or len(page) < self._PAGE_SIZE:
+                break
+            offset += len(page)
+        return bookable[:limit]
 
     def get_item(self, item_id: int) -> dict[str, Any]:
         """
         Get a specific database item by ID.
 
+        Results are cached for 15 seconds and revalidated with the server
+        after that; changes made through this client drop the cached copy.
+
         Args:
             item_id: The ID of the item to retrieve
 
         Returns:
             Dictionary containing item details
         """
-        with self._get_client() as client:
-            response = client.get(f"{self.base_url}/items/{item_id}")
-            response.raise_for_status()
-            return response.json()
+        cached = self._item_cache.get(item_id)
+        if cached is not None:
+            return cached
+        item = self._cached_get(f"/items/{item_id}")
+        self._item_cache.set(item_id, item)
+        return item
+
+    def get_bookable_item_details(self, item_ids: list[int]) -> list[dict[str, Any]]:
+        """
+        Get the details of several bookable items, fetching them concurrently.
+
+        Only the booking settings are needed from them, so results are
+        cached for five minutes; changes made through this client drop the
+        cached copy.
+
+        Args:
+            item_ids: The IDs of the items to retrieve
+
+        Returns:
+            List of item details, in the same order as item_ids
+        """
+
+        def get(item_id: int) -> dict[str, Any]:
+            cached = self._bookable_cache.get(item_id)
+            if cached is not None:
+                return cached
+            item = self._cached_get(f"/items/{item_id}")
+            self._bookable_cache.set(item_id, item)
+            return item
+
+        return self._run_concurrently(get, item_ids)
 
     def create_item(
         self,
@@ -550,55 +1267,58 @@ class ElabFTWClient:
         # Create the item with category
         data = {"category_id": category}
 
-        with self._get_client() as client:
-            response = client.post(
-                f"{self.base_url}/items",
-                json=data,
-            )
-            response.raise_for_status()
+        response = self._client.post(
+            "/items",
+            json=data,
+        )
+        response.raise_for_status()
+        self._list_cache.clear()
 
-            # Get the created item ID from the Location header
-            location = response.headers.get("Location", "")
-            item_id = int(location.split("/")[-1]) if location else None
+        # Get the created item ID from the Location header
+        item_id = _parse_new_id(response)
 
-            if item_id is None:
-                return {
-                    "status": "error",
-                    "message": "Could not determine created item ID",
-                }
+        if item_id is None:
+            return {
+                "status": "error",
+                "message": "Could not determine created item ID",
+            }
 
-            # Now update with title and body if provided
-            update_data = {}
-            if title:
-                update_data["title"] = title
-            if body:
-                update_data["body"] = body
+        # Now update with title and body if provided
+        update_data = {}
+        if title:
+            update_data["title"] = title
+        if body:
+            update_data["body"] = body
 
+        # The tags don't depend on the title/body PATCH, so send them alongside it
+        tag_errors = {}
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            tag_future = (
+                executor.submit(self._add_tags, f"/items/{item_id}/tags", tags)
+                if tags
+                else None
+            )
             if update_data:
-                patch_response = client.patch(
-                    f"{self.base_url}/items/{item_id}",
+                patch_response = self._client.patch(
+                    f"/items/{item_id}",
                     json=update_data,
                 )
                 patch_response.raise_for_status()
-
-            # Add tags if provided
-            if tags:
-                for tag in tags:
-                    try:
-                        client.post(
-                            f"{self.base_url}/items/{item_id}/tags",
-                            json={"tag": tag},
-                        )
-                    except httpx.HTTPStatusError:
-                        pass  # Tag might already exist
-
-            # Return the created item info
-            return {
-                "status": "success",
-                "item_id": item_id,
-                "title": title or "(default from category)",
-                "message": f"Item created successfully with ID {item_id}",
-            }
+            if tag_future is not None:
+                tag_errors = tag_future.result()
+        # A listing made between the POST and here cached the untitled row
+        self._forget_item(item_id)
+
+        # Return the created item info
+        result = {
+            "status": "success",
+            "item_id": item_id,
+            "title": title or "(default from category)",
+            "message": f"Item created successfully with ID {item_id}",
+        }
+        if tag_errors:
+            result["tag_errors"] = tag_errors
+        return result
 
     def update_item(
         self,
@@ -637,17 +1357,17 @@ class ElabFTWClient:
                 "message": "No fields to update. Provide at least one of: title, body, category, rating",
             }
 
-        with self._get_client() as client:
-            response = client.patch(
-                f"{self.base_url}/items/{item_id}",
-                json=data,
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Item {item_id} updated successfully",
-                "updated_fields": list(data.keys()),
-            }
+        response = self._client.patch(
+            f"/items/{item_id}",
+            json=data,
+        )
+        response.raise_for_status()
+        self._forget_item(item_id)
+        return {
+            "status": "success",
+            "message": f"Item {item_id} updated successfully",
+            "updated_fields": list(data.keys()),
+        }
 
     def delete_item(self, item_id: int) -> dict[str, Any]:
         """
@@ -659,19 +1379,20 @@ class ElabFTWClient:
         Returns:
             Success message
         """
-        with self._get_client() as client:
-            response = client.delete(
-                f"{self.base_url}/items/{item_id}",
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Item {item_id} has been deleted",
-            }
+        response = self._client.delete(
+            f"/items/{item_id}",
+        )
+        response.raise_for_status()
+        self._forget_item(item_id)
+        return {
+            "status": "success",
+            "message": f"Item {item_id} has been deleted",
+        }
 
     def list_items_types(
         self,
         team_id: int = 1,
+        refresh: bool = False,
     ) -> list[dict[str, Any]]:
         """
         List available item types/categories for a team.
@@ -681,16 +1402,12 @@ class ElabFTWClient:
 
         Args:
             team_id: The team ID to get item types for (default: 1)
+            refresh: Bypass the cached listing and read it from the server
 
         Returns:
             List of item types with id, title, color, and other metadata
         """
-        with self._get_client() as client:
-            response = client.get(
-                f"{self.base_url}/teams/{team_id}/items_types",
-            )
-            response.raise_for_status()
-            return response.json()
+        return self._get_lookup(f"/teams/{team_id}/items_types", refresh=refresh)
 
     def add_tag_to_item(self, item_id: int, tag: str) -> dict[str, Any]:
         """
@@ -703,16 +1420,16 @@ class ElabFTWClient:
         Returns:
             Success message
         """
-        with self._get_client() as client:
-            response = client.post(
-                f"{self.base_url}/items/{item_id}/tags",
-                json={"tag": tag},
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Tag '{tag}' added to item {item_id}",
-            }
+        response = self._client.post(
+            f"/items/{item_id}/tags",
+            json={"tag": tag},
+        )
+        response.raise_for_status()
+        self._forget_item(item_id)
+        return {
+            "status": "success",
+            "message": f"Tag '{tag}' added to item {item_id}",
+        }
 
     def remove_tag_from_item(self, item_id: int, tag_id: int) -> dict[str, Any]:
         """
@@ -725,15 +1442,15 @@ class ElabFTWClient:
         Returns:
             Success message
         """
-        with self._get_client() as client:
-            response = client.delete(
-                f"{self.base_url}/items/{item_id}/tags/{tag_id}",
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Tag {tag_id} removed from item {item_id}",
-            }
+        response = self._client.delete(
+            f"/items/{item_id}/tags/{tag_id}",
+        )
+        response.raise_for_status()
+        self._forget_item(item_id)
+        return {
+            "status": "success",
+            "message": f"Tag {tag_id} removed from item {item_id}",
+        }
 
     def upload_attachment_to_item(
         self,
@@ -752,30 +1469,31 @@ class ElabFTWClient:
         Returns:
             Dictionary with upload result
         """
-        import os
-
-        if not os.path.exists(file_path):
+        if not os.path.isfile(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
-
-        with self._get_client() as client:
-            with open(file_path, "rb") as f:
-                files = {"file": (os.path.basename(file_path), f)}
-                data = {}
-                if comment:
-                    data["comment"] = comment
-
-                headers = {"Authorization": self.api_key}
-                response = client.post(
-                    f"{self.base_url}/items/{item_id}/uploads",
-                    files=files,
-                    data=data,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                return {
-                    "status": "success",
-                    "message": f"File '{os.path.basename(file_path)}' uploaded to item {item_id}",
-                }
+        size = os.stat(file_path).st_size
+
+        # httpx streams the open file into the multipart body chunk by chunk,
+        # so memory use does not grow with the file size
+        with open(file_path, "rb") as f:
+            files = {"file": (os.path.basename(file_path), f)}
+            data = {}
+            if comment:
+                data["comment"] = comment
+
+            response = self._client.post(
+                f"/items/{item_id}/uploads",
+                files=files,
+                data=data,
+                timeout=self._UPLOAD_TIMEOUT,
+            )
+            response.raise_for_status()
+            self._forget_item(item_id)
+            return {
+                "status": "success",
+                "message": f"File '{os.path.basename(file_path)}' uploaded to item {item_id}",
+                "size_bytes": size,
+            }
 
     def link_item_to_item(
         self,
@@ -797,15 +1515,15 @@ class ElabFTWClient:
         if link_type not in ("experiments", "items"):
             raise ValueError("link_type must be 'experiments' or 'items'")
 
-        with self._get_client() as client:
-            response = client.post(
-                f"{self.base_url}/items/{item_id}/{link_type}_links/{link_id}",
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Linked {link_type[:-1]} {link_id} to item {item_id}",
-            }
+        response = self._client.post(
+            f"/items/{item_id}/{link_type}_links/{link_id}",
+        )
+        response.raise_for_status()
+        self._forget_item(item_id)
+        return {
+            "status": "success",
+            "message": f"Linked {link_type[:-1]} {link_id} to item {item_id}",
+        }
 
     # ==================== BOOKING/EVENTS METHODS ====================
 
@@ -816,35 +1534,90 @@ class ElabFTWClient:
         start: Optional[str] = None,
         end: Optional[str] = None,
         item_id: Optional[int] = None,
+        fields: Optional[list[str]] = None,
+        after: Optional[str] = None,
     ) -> list[dict[str, Any]]:
         """
         List booking events from elabFTW.
 
+        For paging through long schedules, pass the cursor of the last event
+        seen (see _event_cursor) as 'after' instead of a growing offset. The
+        cursor's start time becomes the server-side 'start' filter, and events
+        at or before the cursor are dropped, so every page costs the same
+        regardless of how deep it is.
+
         Args:
             limit: Maximum number of events to return (default: 50)
             offset: Number of events to skip (for pagination)
-            start: Filter events starting after this datetime (ISO format)
-            end: Filter events ending before this datetime (ISO format)
+            start: Filter events starting at or after this datetime (ISO format)
+            end: Filter events ending before this datetime (ISO format, exclusive).
+                 A bare date such as "2024-01-15" includes that whole day.
             item_id: Filter events for specific item
+            fields: Optional list of event fields to request. Sent as a
+                    projection hint; servers that ignore it return full rows.
+            after: Optional cursor ("<start>|<id>") of the last event of the
+                   previous page; replaces offset when given
 
         Returns:
             List of booking events
         """
-        params = {"limit": limit, "offset": offset}
-        if start:
-            params["start"] = start
-        if end:
-            params["end"] = end
-        if item_id:
-            params["item"] = item_id
-
-        with self._get_client() as client:
-            response = client.get(
-                f"{self.base_url}/events",
-                params=params,
+        # Agents tend to ask for the same window (e.g. today) several times in
+        # a row; serve repeats from a short-lived memo that booking changes
+        # made through this client clear
+        key = (limit, offset, start, end, item_id, tuple(fields or ()), after)
+        events = self._events_cache.get(key)
+        if events is None:
+            events = self._fetch_events(
+                limit, offset, start, end, item_id, fields, after
             )
-            response.raise_for_status()
-            return response.json()
+            self._events_cache.set(key, events)
+        return events
+
+    def _fetch_events(
+        self,
+        limit: int,
+        offset: int,
+        start: Optional[str],
+        end: Optional[str],
+        item_id: Optional[int],
+        fields: Optional[list[str]],
+        after: Optional[str],
+    ) -> list[dict[str, Any]]:
+        """Fetch events from the server; see list_events for the arguments."""
+        start, end = _iso_half_open(start, end)
+        params = _build_params(
+            limit=limit,
+            offset=offset,
+            start=start,
+            end=end,
+            item=item_id,
+            fields=",".join(fields) if fields else None,
+        )
+
+        if not after:
+            return self._cached_get("/events", params=params)
+
+        after_start, _, after_id = after.rpartition("|")
+        if not after_start or not after_id.isdigit():
+            raise ValueError(f"Invalid cursor: {after!r}")
+        params["start"] = max(after_start, start or "")
+        params["offset"] = 0
+        cursor = (after_start, int(after_id))
+
+        # Only events sharing the cursor's start time get dropped, so this
+        # normally takes a single request
+        events: list[dict[str, Any]] = []
+        for _ in range(self._MAX_SCAN_PAGES):
+            page = self._cached_get("/events", params=params)
+            events.extend(
+                event
+                for event in page
+                if (event.get("start") or "", event.get("id") or 0) > cursor
+            )
+            if len(events) >= limit or len(page) < limit:
+                break
+            params["offset"] += len(page)
+        return events[:limit]
 
     def get_event(self, event_id: int) -> dict[str, Any]:
         """
@@ -856,10 +1629,12 @@ class ElabFTWClient:
         Returns:
             Dictionary containing event details
         """
-        with self._get_client() as client:
-            response = client.get(f"{self.base_url}/events/{event_id}")
-            response.raise_for_status()
-            return response.json()
+        cached = self._event_cache.get(event_id)
+        if cached is not None:
+            return cached
+        event = self._cached_get(f"/events/{event_id}")
+        self._event_cache.set(event_id, event)
+        return event
 
     def create_booking(
         self,
@@ -880,31 +1655,95 @@ class ElabFTWClient:
         Returns:
             Dictionary with created booking details
         """
+        start_dt = _parse_iso(start, "start")
+        end_dt = _parse_iso(end, "end")
+        _check_booking_range(start_dt, end_dt)
+
         data = {
             "item": item_id,
-            "start": start,
-            "end": end,
+            "start": start_dt.isoformat(),
+            "end": end_dt.isoformat(),
         }
         if title:
             data["title"] = title
 
-        with self._get_client() as client:
-            response = client.post(
-                f"{self.base_url}/events",
-                json=data,
+        response = self._client.post(
+            "/events",
+            content=_dumps_compact(data),
+            headers=self._BOOKING_WRITE_HEADERS,
+        )
+        response.raise_for_status()
+        self._events_cache.clear()
+
+        # Use the representation if the server sent one back, saving a GET
+        event = _json_body(response)
+        if event:
+            return event
+
+        # Otherwise describe it from the request and the Location header
+        event_id = _parse_new_id(response)
+        if event_id is not None:
+            return {"id": event_id, **data}
+
+        return {
+            "status": "success",
+            "message": "Booking created successfully",
+        }
+
+    def create_bookings(self, bookings: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Create several bookings at once.
+
+        elabFTW has no batch endpoint, so each booking is still its own
+        request, but they are sent concurrently over the pooled client.
+        All entries are checked before anything is sent, so a malformed slot
+        cannot leave the others half created. A booking that fails once
+        sending has started (e.g. an overlapping slot) does not abort the
+        others.
+
+        Args:
+            bookings: List of dicts with item_id, start, end and optional title
+
+        Returns:
+            One entry per booking, in input order: the created booking, or an
+            error dict if it failed
+
+        Raises:
+            ValueError: If any entry is malformed; no booking is created then
+        """
+        problems = []
+        for number, booking in enumerate(bookings, 1):
+            try:
+                if "item_id" not in booking:
+                    raise ValueError("item_id is required")
+                _check_booking_range(
+                    _parse_iso(booking["start"], "start"),
+                    _parse_iso(booking["end"], "end"),
+                )
+            except KeyError as e:
+                problems.append(f"booking {number}: missing {e}")
+            except ValueError as e:
+                problems.append(f"booking {number}: {e}")
+        if problems:
+            raise ValueError(
+                "No bookings were created; fix these first: " + "; ".join(problems)
             )
-            response.raise_for_status()
 
-            # Try to get the created event ID from Location header
-            location = response.headers.get("location", "")
-            if location:
-                event_id = int(location.split("/")[-1])
-                return self.get_event(event_id)
+        def create(booking: dict[str, Any]) -> dict[str, Any]:
+            try:
+                return self.create_booking(
+                    item_id=booking["item_id"],
+                    start=booking["start"],
+                    end=booking["end"],
+                    title=booking.get("title"),
+                )
+            except httpx.HTTPStatusError as e:
+                message = f"HTTP Error {e.response.status_code}: {e.response.text}"
+            except (ValueError, KeyError, httpx.HTTPError) as e:
+                message = f"{type(e).__name__}: {e}"
+            return {"status": "error", "message": message, "booking": booking}
 
-            return {
-                "status": "success",
-                "message": "Booking created successfully",
-            }
+        return self._run_concurrently(create, bookings)
 
     def update_booking(
         self,
@@ -927,22 +1766,31 @@ class ElabFTWClient:
         """
         data = {}
         if start is not None:
-            data["start"] = start
+            start_dt = _parse_iso(start, "start")
+            data["start"] = start_dt.isoformat()
         if end is not None:
-            data["end"] = end
+            end_dt = _parse_iso(end, "end")
+            data["end"] = end_dt.isoformat()
+        if start is not None and end is not None:
+            _check_booking_range(start_dt, end_dt)
         if title is not None:
             data["title"] = title
 
         if not data:
             raise ValueError("At least one field must be provided for update")
 
-        with self._get_client() as client:
-            response = client.patch(
-                f"{self.base_url}/events/{event_id}",
-                json=data,
-            )
-            response.raise_for_status()
-            return self.get_event(event_id)
+        response = self._client.patch(
+            f"/events/{event_id}",
+            content=_dumps_compact(data),
+            headers=self._BOOKING_WRITE_HEADERS,
+        )
+        response.raise_for_status()
+        self._events_cache.clear()
+        self._event_cache.pop(event_id)
+        event = _json_body(response)
+        if event is not None:
+            return event
+        return {"id": event_id, **data}
 
     def delete_booking(self, event_id: int) -> dict[str, Any]:
         """
@@ -954,13 +1802,14 @@ class ElabFTWClient:
         Returns:
             Success message
         """
-        with self._get_client() as client:
-            response = client.delete(f"{self.base_url}/events/{event_id}")
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Booking {event_id} has been cancelled",
-            }
+        response = self._client.delete(f"/events/{event_id}")
+        response.raise_for_status()
+        self._events_cache.clear()
+        self._event_cache.pop(event_id)
+        return {
+            "status": "success",
+            "message": f"Booking {event_id} has been cancelled",
+        }
 
     # ==================== UPLOAD LISTING METHODS ====================
 
@@ -974,18 +1823,14 @@ class ElabFTWClient:
         Returns:
             List of upload metadata dicts (filename, size, uploader, date, download_url)
         """
-        with self._get_client() as client:
-            response = client.get(
-                f"{self.base_url}/experiments/{experiment_id}/uploads"
+        response = self._client.get(f"/experiments/{experiment_id}/uploads")
+        response.raise_for_status()
+        uploads = _loads(response.content)
+        for u in uploads:
+            u["download_url"] = self._download_url.format(
+                long_name=u["long_name"], real_name=u["real_name"]
             )
-            response.raise_for_status()
-            uploads = response.json()
-            base = self.base_url.replace("/api/v2", "")
-            for u in uploads:
-                u["download_url"] = (
-                    f"{base}/app/download.php?f={u['long_name']}&name={u['real_name']}"
-                )
-            return uploads
+        return uploads
 
     def list_item_uploads(self, item_id: int) -> list[dict[str, Any]]:
         """
@@ -997,172 +1842,166 @@ class ElabFTWClient:
         Returns:
             List of upload metadata dicts (filename, size, uploader, date, download_url)
         """
-        with self._get_client() as client:
-            response = client.get(f"{self.base_url}/items/{item_id}/uploads")
-            response.raise_for_status()
-            uploads = response.json()
-            base = self.base_url.replace("/api/v2", "")
-            for u in uploads:
-                u["download_url"] = (
-                    f"{base}/app/download.php?f={u['long_name']}&name={u['real_name']}"
-                )
-            return uploads
+        response = self._client.get(f"/items/{item_id}/uploads")
+        response.raise_for_status()
+        uploads = _loads(response.content)
+        for u in uploads:
+            u["download_url"] = self._download_url.format(
+                long_name=u["long_name"], real_name=u["real_name"]
+            )
+        return uploads
 
     # ==================== STEPS METHODS ====================
 
     def add_experiment_step(self, experiment_id: int, body: str) -> dict[str, Any]:
         """Add a checklist step/task to an experiment."""
-        with self._get_client() as client:
-            response = client.post(
-                f"{self.base_url}/experiments/{experiment_id}/steps",
-                json={"body": body},
-            )
-            response.raise_for_status()
-            location = response.headers.get("location", "")
-            step_id = int(location.split("/")[-1]) if location else None
-            return {
-                "status": "success",
-                "step_id": step_id,
-                "message": f"Step added to experiment {experiment_id}",
-            }
+        response = self._client.post(
+            f"/experiments/{experiment_id}/steps",
+            json={"body": body},
+        )
+        response.raise_for_status()
+        self._forget_experiment(experiment_id)
+        step_id = _parse_new_id(response)
+        return {
+            "status": "success",
+            "step_id": step_id,
+            "message": f"Step added to experiment {experiment_id}",
+        }
 
     def update_experiment_step(
         self, experiment_id: int, step_id: int, body: str
     ) -> dict[str, Any]:
         """Update the text of an experiment step."""
-        with self._get_client() as client:
-            response = client.patch(
-                f"{self.base_url}/experiments/{experiment_id}/steps/{step_id}",
-                json={"body": body},
-            )
-            response.raise_for_status()
-            return {"status": "success", "message": f"Step {step_id} updated"}
+        response = self._client.patch(
+            f"/experiments/{experiment_id}/steps/{step_id}",
+            json={"body": body},
+        )
+        response.raise_for_status()
+        self._forget_experiment(experiment_id)
+        return {"status": "success", "message": f"Step {step_id} updated"}
 
     def delete_experiment_step(
         self, experiment_id: int, step_id: int
     ) -> dict[str, Any]:
         """Delete a step from an experiment."""
-        with self._get_client() as client:
-            response = client.delete(
-                f"{self.base_url}/experiments/{experiment_id}/steps/{step_id}",
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Step {step_id} deleted from experiment {experiment_id}",
-            }
+        response = self._client.delete(
+            f"/experiments/{experiment_id}/steps/{step_id}",
+        )
+        response.raise_for_status()
+        self._forget_experiment(experiment_id)
+        return {
+            "status": "success",
+            "message": f"Step {step_id} deleted from experiment {experiment_id}",
+        }
 
     def add_item_step(self, item_id: int, body: str) -> dict[str, Any]:
         """Add a checklist step/maintenance task to a database item."""
-        with self._get_client() as client:
-            response = client.post(
-                f"{self.base_url}/items/{item_id}/steps",
-                json={"body": body},
-            )
-            response.raise_for_status()
-            location = response.headers.get("location", "")
-            step_id = int(location.split("/")[-1]) if location else None
-            return {
-                "status": "success",
-                "step_id": step_id,
-                "message": f"Step added to item {item_id}",
-            }
+        response = self._client.post(
+            f"/items/{item_id}/steps",
+            json={"body": body},
+        )
+        response.raise_for_status()
+        self._forget_item(item_id)
+        step_id = _parse_new_id(response)
+        return {
+            "status": "success",
+            "step_id": step_id,
+            "message": f"Step added to item {item_id}",
+        }
 
     def update_item_step(
         self, item_id: int, step_id: int, body: str
     ) -> dict[str, Any]:
         """Update the text of an item step."""
-        with self._get_client() as client:
-            response = client.patch(
-                f"{self.base_url}/items/{item_id}/steps/{step_id}",
-                json={"body": body},
-            )
-            response.raise_for_status()
-            return {"status": "success", "message": f"Step {step_id} updated"}
+        response = self._client.patch(
+            f"/items/{item_id}/steps/{step_id}",
+            json={"body": body},
+        )
+        response.raise_for_status()
+        self._forget_item(item_id)
+        return {"status": "success", "message": f"Step {step_id} updated"}
 
     def delete_item_step(self, item_id: int, step_id: int) -> dict[str, Any]:
         """Delete a step from a database item."""
-        with self._get_client() as client:
-            response = client.delete(
-                f"{self.base_url}/items/{item_id}/steps/{step_id}",
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Step {step_id} deleted from item {item_id}",
-            }
+        response = self._client.delete(
+            f"/items/{item_id}/steps/{step_id}",
+        )
+        response.raise_for_status()
+        self._forget_item(item_id)
+        return {
+            "status": "success",
+            "message": f"Step {step_id} deleted from item {item_id}",
+        }
 
     # ==================== COMMENTS METHODS ====================
 
     def list_experiment_comments(self, experiment_id: int) -> list[dict[str, Any]]:
         """List all comments on an experiment."""
-        with self._get_client() as client:
-            response = client.get(
-                f"{self.base_url}/experiments/{experiment_id}/comments"
-            )
-            response.raise_for_status()
-            return response.json()
+        response = self._client.get(
+            f"/experiments/{experiment_id}/comments"
+        )
+        response.raise_for_status()
+        return _loads(response.content)
 
     def add_experiment_comment(
         self, experiment_id: int, comment: str
     ) -> dict[str, Any]:
         """Add a comment to an experiment."""
-        with self._get_client() as client:
-            response = client.post(
-                f"{self.base_url}/experiments/{experiment_id}/comments",
-                json={"comment": comment},
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Comment added to experiment {experiment_id}",
-            }
+        response = self._client.post(
+            f"/experiments/{experiment_id}/comments",
+            json={"comment": comment},
+        )
+        response.raise_for_status()
+        self._forget_experiment(experiment_id)
+        return {
+            "status": "success",
+            "message": f"Comment added to experiment {experiment_id}",
+        }
 
     def delete_experiment_comment(
         self, experiment_id: int, comment_id: int
     ) -> dict[str, Any]:
         """Delete a comment from an experiment. Use the id from list_experiment_comments."""
-        with self._get_client() as client:
-            response = client.delete(
-                f"{self.base_url}/experiments/{experiment_id}/comments/{comment_id}",
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Comment {comment_id} deleted from experiment {experiment_id}",
-            }
+        response = self._client.delete(
+            f"/experiments/{experiment_id}/comments/{comment_id}",
+        )
+        response.raise_for_status()
+        self._forget_experiment(experiment_id)
+        return {
+            "status": "success",
+            "message": f"Comment {comment_id} deleted from experiment {experiment_id}",
+        }
 
     def list_item_comments(self, item_id: int) -> list[dict[str, Any]]:
         """List all comments on a database item."""
-        with self._get_client() as client:
-            response = client.get(f"{self.base_url}/items/{item_id}/comments")
-            response.raise_for_status()
-            return response.json()
+        response = self._client.get(f"/items/{item_id}/comments")
+        response.raise_for_status()
+        return _loads(response.content)
 
     def add_item_comment(self, item_id: int, comment: str) -> dict[str, Any]:
         """Add a comment to a database item."""
-        with self._get_client() as client:
-            response = client.post(
-                f"{self.base_url}/items/{item_id}/comments",
-                json={"comment": comment},
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Comment added to item {item_id}",
-            }
+        response = self._client.post(
+            f"/items/{item_id}/comments",
+            json={"comment": comment},
+        )
+        response.raise_for_status()
+        self._forget_item(item_id)
+        return {
+            "status": "success",
+            "message": f"Comment added to item {item_id}",
+        }
 
     def delete_item_comment(self, item_id: int, comment_id: int) -> dict[str, Any]:
         """Delete a comment from a database item. Use the id from list_item_comments."""
-        with self._get_client() as client:
-            response = client.delete(
-                f"{self.base_url}/items/{item_id}/comments/{comment_id}",
-            )
-            response.raise_for_status()
-            return {
-                "status": "success",
-                "message": f"Comment {comment_id} deleted from item {item_id}",
-            }
+        response = self._client.delete(
+            f"/items/{item_id}/comments/{comment_id}",
+        )
+        response.raise_for_status()
+        self._forget_item(item_id)
+        return {
+            "status": "success",
+            "message": f"Comment {comment_id} deleted from item {item_id}",
+        }
 
     # ==================== PUBCHEM METHODS ====================
 
@@ -1177,7 +2016,8 @@ class ElabFTWClient:
             Dict with compound properties, or {"error": "..."} if not found
         """
         url = (
-            f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/name/{identifier}"
+            "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/name/"
+            f"{quote(identifier, safe='')}"
             "/property/MolecularFormula,MolecularWeight,IUPACName,"
             "IsomericSMILES,InChIKey,XLogP,HBondDonorCount,HBondAcceptorCount/JSON"
         )
@@ -1187,7 +2027,7 @@ class ElabFTWClient:
                 return {"error": f"Compound '{identifier}' not found on PubChem"}
             response.raise_for_status()
             props = (
-                response.json()
+                _loads(response.content)
                 .get("PropertyTable", {})
                 .get("Properties", [{}])[0]
             )
@@ -1284,60 +2124,57 @@ server = Server("elabftw-mcp")
 elabftw_client = ElabFTWClient(API_BASE_URL, API_KEY, VERIFY_SSL)
 
 
+PROMPTS: list[Prompt] = [
+    Prompt(
+        name="elabftw-overview",
+        description="Get an overview of available elabFTW operations and how to use this MCP server",
+        arguments=[],
+    ),
+    Prompt(
+        name="create-experiment-guide",
+        description="Step-by-step guide for creating a new experiment in elabFTW",
+        arguments=[
+            PromptArgument(
+                name="title",
+                description="The title for your new experiment",
+                required=False,
+            ),
+        ],
+    ),
+    Prompt(
+        name="manage-resources-guide",
+        description="Guide for managing resources/items (reagents, equipment, samples) in elabFTW",
+        arguments=[],
+    ),
+    Prompt(
+        name="search-experiments",
+        description="Help with searching and filtering experiments",
+        arguments=[
+            PromptArgument(
+                name="search_term",
+                description="What you're looking for in experiments",
+                required=False,
+            ),
+        ],
+    ),
+]
+
+
 @server.list_prompts()
 async def list_prompts() -> list[Prompt]:
     """List available prompts for elabFTW interactions."""
-    return [
-        Prompt(
-            name="elabftw-overview",
-            description="Get an overview of available elabFTW operations and how to use this MCP server",
-            arguments=[],
-        ),
-        Prompt(
-            name="create-experiment-guide",
-            description="Step-by-step guide for creating a new experiment in elabFTW",
-            arguments=[
-                PromptArgument(
-                    name="title",
-                    description="The title for your new experiment",
-                    required=False,
-                ),
-            ],
-        ),
-        Prompt(
-            name="manage-resources-guide",
-            description="Guide for managing resources/items (reagents, equipment, samples) in elabFTW",
-            arguments=[],
-        ),
-        Prompt(
-            name="search-experiments",
-            description="Help with searching and filtering experiments",
-            arguments=[
-                PromptArgument(
-                    name="search_term",
-                    description="What you're looking for in experiments",
-                    required=False,
-                ),
-            ],
-        ),
-    ]
+    return PROMPTS
 
 
-@server.get_prompt()
-async def get_prompt(
-    name: str, arguments: dict[str, str] | None = None
-) -> GetPromptResult:
-    """Get a specific prompt by name."""
-
-    if name == "elabftw-overview":
-        return GetPromptResult(
-            description="Overview of elabFTW MCP Server capabilities",
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text="""# elabFTW MCP Server Overview
+# Prompts without arguments are built once at import time
+_OVERVIEW_RESULT = GetPromptResult(
+    description="Overview of elabFTW MCP Server capabilities",
+    messages=[
+        PromptMessage(
+            role="user",
+            content=TextContent(
+                type="text",
+                text="""# elabFTW MCP Server Overview
 
 This MCP server provides tools to interact with elabFTW, an electronic lab notebook system.
 
@@ -1347,6 +2184,7 @@ This MCP server provides tools to interact with elabFTW, an electronic lab noteb
 - **list_experiments** - List all experiments (with optional search)
 - **get_experiment** - Get details of a specific experiment by ID
 - **create_experiment** - Create a new experiment (can use templates and categories)
+- **create_experiment_guided** - Pick a template and category by name and create the experiment in one call
 - **update_experiment** - Update an existing experiment's title, body, or metadata
 - **delete_experiment** - Delete an experiment
 - **set_experiment_status** - Change experiment status (running, completed, etc.)
@@ -1375,69 +2213,19 @@ This MCP server provides tools to interact with elabFTW, an electronic lab noteb
 3. Use `create_experiment` with a template ID and category ID for best results
 
 Please tell me what you'd like to do with elabFTW!""",
-                    ),
-                ),
-            ],
-        )
-
-    elif name == "create-experiment-guide":
-        title = (
-            arguments.get("title", "[Your Experiment Title]")
-            if arguments
-            else "[Your Experiment Title]"
-        )
-        return GetPromptResult(
-            description="Guide for creating a new experiment",
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=f"""# Creating a New Experiment in elabFTW
-
-I want to create a new experiment with the title: **{title}**
-
-## Steps to follow:
-
-### Step 1: Check available templates
-First, list the available experiment templates to see what structures are available:
-- Use `list_experiment_templates` tool
-
-### Step 2: Check available categories
-Then, list the experiment categories for classification:
-- Use `list_experiment_categories` tool
-
-### Step 3: Create the experiment
-Create the experiment using:
-- Use `create_experiment` tool with:
-  - `title`: "{title}"
-  - `template`: (optional) ID from step 1
-  - `category`: (optional) ID from step 2
-  - `body`: (optional) HTML content for the experiment body
-  - `tags`: (optional) list of tags like ["tag1", "tag2"]
-
-### Step 4: Add more details (optional)
-After creation, you can:
-- Use `update_experiment` to modify content
-- Use `add_tag_to_experiment` to add more tags
-- Use `upload_attachment` to attach files
-- Use `link_item_to_experiment` to link resources
-
-Please start by listing the available templates and categories, then create the experiment.""",
-                    ),
-                ),
-            ],
-        )
+            ),
+        ),
+    ],
+)
 
-    elif name == "manage-resources-guide":
-        return GetPromptResult(
-            description="Guide for managing resources/items in elabFTW",
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text="""# Managing Resources/Items in elabFTW
+_MANAGE_RESOURCES_RESULT = GetPromptResult(
+    description="Guide for managing resources/items in elabFTW",
+    messages=[
+        PromptMessage(
+            role="user",
+            content=TextContent(
+                type="text",
+                text="""# Managing Resources/Items in elabFTW
 
 Resources (also called "Items" or "Database Items") in elabFTW are used to track:
 - Reagents and chemicals
@@ -1473,57 +2261,19 @@ Resources (also called "Items" or "Database Items") in elabFTW are used to track
 3. Link items to experiments as needed
 
 What would you like to do with resources/items?""",
-                    ),
-                ),
-            ],
-        )
-
-    elif name == "search-experiments":
-        search_term = arguments.get("search_term", "") if arguments else ""
-        if search_term:
-            return GetPromptResult(
-                description=f"Help searching for experiments related to: {search_term}",
-                messages=[
-                    PromptMessage(
-                        role="user",
-                        content=TextContent(
-                            type="text",
-                            text=f"""# Searching Experiments in elabFTW
-
-I want to find experiments related to: **{search_term}**
-
-## Search Options
-
-Use the `list_experiments` tool with:
-- `search`: "{search_term}" - Search in titles and content
-- `limit`: Number of results to return (default: 15)
-- `offset`: For pagination
-
-## Example
-Search for experiments containing "{search_term}":
-```
-list_experiments(search="{search_term}", limit=20)
-```
-
-## Tips
-- The search looks in experiment titles and body content
-- Use specific keywords for better results
-- You can combine with `get_experiment` to see full details of interesting results
+            ),
+        ),
+    ],
+)
 
-Please search for experiments related to "{search_term}".""",
-                        ),
-                    ),
-                ],
-            )
-        else:
-            return GetPromptResult(
-                description="Help with searching experiments",
-                messages=[
-                    PromptMessage(
-                        role="user",
-                        content=TextContent(
-                            type="text",
-                            text="""# Searching Experiments in elabFTW
+_SEARCH_HELP_RESULT = GetPromptResult(
+    description="Help with searching experiments",
+    messages=[
+        PromptMessage(
+            role="user",
+            content=TextContent(
+                type="text",
+                text="""# Searching Experiments in elabFTW
 
 ## How to Search
 
@@ -1550,1694 +2300,2312 @@ Once you find an experiment of interest:
 - The full details include body content, tags, attachments, and linked items
 
 What would you like to search for?""",
-                        ),
-                    ),
-                ],
-            )
+            ),
+        ),
+    ],
+)
 
-    else:
-        raise ValueError(f"Unknown prompt: {name}")
+# Text of the prompts that interpolate an argument, filled in with str.format
+_CREATE_GUIDE_TEMPLATE = """# Creating a New Experiment in elabFTW
 
+I want to create a new experiment with the title: **{title}**
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools for elabFTW interactions."""
-    return [
-        Tool(
-            name="lab_prompt_elabftw",
-            description="Return the integrated eLabFTW lab prompt content for LLM guidance. This provides the system prompt that defines how the AI assistant should behave when working with eLabFTW data.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        ),
-        Tool(
-            name="list_experiment_templates",
-            description="List available experiment TEMPLATES from elabFTW. Templates define the initial structure/content of experiments. Use the returned 'id' as the 'template' parameter when creating experiments. Note: This is DIFFERENT from categories - use list_experiment_categories for classification categories.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of templates to return (default: 15)",
-                        "default": 15,
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Number of templates to skip for pagination (default: 0)",
-                        "default": 0,
-                    },
-                },
-                "required": [],
-            },
-        ),
-        Tool(
-            name="list_experiment_categories",
-            description="List available experiment CATEGORIES from elabFTW. Categories are used to classify/organize experiments (e.g., 'PCR', 'Western Blot'). Use the returned 'id' as the 'category' parameter when creating or updating experiments. Note: This is DIFFERENT from templates.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "team_id": {
-                        "type": "integer",
-                        "description": "Team ID to get categories for (default: 1)",
-                        "default": 1,
-                    },
+## Steps to follow:
+
+### Step 1: Create the experiment
+Use the `create_experiment_guided` tool, which looks up templates and
+categories and creates the experiment in a single call:
+  - `title`: "{title}"
+  - `template_hint`: (optional) template ID or title, e.g. "PCR"
+  - `category_hint`: (optional) category ID or title, e.g. "Western Blot"
+  - `body`: (optional) HTML content for the experiment body
+  - `tags`: (optional) list of tags like ["tag1", "tag2"]
+
+The result lists the available templates and categories, so if a hint does
+not match (the tool reports the options) or the wrong one was picked, you can
+retry or adjust with `update_experiment`.
+
+### Step 2: Add more details (optional)
+After creation, you can:
+- Use `update_experiment` to modify content
+- Use `add_tag_to_experiment` to add more tags
+- Use `upload_attachment` to attach files
+- Use `link_item_to_experiment` to link resources
+
+Please create the experiment with `create_experiment_guided`."""
+
+_SEARCH_TEMPLATE = """# Searching Experiments in elabFTW
+
+I want to find experiments related to: **{search_term}**
+
+## Search Options
+
+Use the `list_experiments` tool with:
+- `search`: "{search_term}" - Search in titles and content
+- `limit`: Number of results to return (default: 15)
+- `offset`: For pagination
+
+## Example
+Search for experiments containing "{search_term}":
+```
+list_experiments(search="{search_term}", limit=20)
+```
+
+## Tips
+- The search looks in experiment titles and body content
+- Use specific keywords for better results
+- You can combine with `get_experiment` to see full details of interesting results
+
+Please search for experiments related to "{search_term}"."""
+
+
+@server.get_prompt()
+async def get_prompt(
+    name: str, arguments: dict[str, str] | None = None
+) -> GetPromptResult:
+    """Get a specific prompt by name."""
+    return _build_prompt(name, tuple(sorted((arguments or {}).items())))
+
+
+# Prompts only depend on their arguments, so repeated requests reuse the result
+@lru_cache(maxsize=128)
+def _build_prompt(
+    name: str, arguments: tuple[tuple[str, str], ...]
+) -> GetPromptResult:
+    """Build the result for a prompt from its (sorted) argument pairs."""
+    args = dict(arguments)
+
+    if name == "elabftw-overview":
+        return _OVERVIEW_RESULT
+
+    elif name == "create-experiment-guide":
+        title = args.get("title", "[Your Experiment Title]")
+        return GetPromptResult(
+            description="Guide for creating a new experiment",
+            messages=[
+                PromptMessage(
+                    role="user",
+                    content=TextContent(
+                        type="text",
+                        text=_CREATE_GUIDE_TEMPLATE.format(title=title),
+                    ),
+                ),
+            ],
+        )
+
+    elif name == "manage-resources-guide":
+        return _MANAGE_RESOURCES_RESULT
+
+    elif name == "search-experiments":
+        search_term = args.get("search_term", "")
+        if search_term:
+            return GetPromptResult(
+                description=f"Help searching for experiments related to: {search_term}",
+                messages=[
+                    PromptMessage(
+                        role="user",
+                        content=TextContent(
+                            type="text",
+                            text=_SEARCH_TEMPLATE.format(search_term=search_term),
+                        ),
+                    ),
+                ],
+            )
+        else:
+            return _SEARCH_HELP_RESULT
+
+    else:
+        raise ValueError(f"Unknown prompt: {name}")
+
+
+# Tool definitions are static, so they are built once at import time rather
+# than on every list_tools request
+TOOLS: list[Tool] = [
+    Tool(
+        name="lab_prompt_elabftw",
+        description="Return the integrated eLabFTW lab prompt content for LLM guidance. This provides the system prompt that defines how the AI assistant should behave when working with eLabFTW data.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="list_experiment_templates",
+        description="List available experiment TEMPLATES from elabFTW. Templates define the initial structure/content of experiments. Use the returned 'id' as the 'template' parameter when creating experiments. Note: This is DIFFERENT from categories - use list_experiment_categories for classification categories.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of templates to return (default: 15, max: 100)",
+                    "default": 15,
+                    "minimum": 1,
+                    "maximum": 100,
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of templates to skip for pagination (default: 0)",
+                    "default": 0,
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Re-read the list from the server instead of the cached copy (kept for a few minutes). Use after templates were changed in elabFTW.",
+                    "default": False,
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Indent the JSON output for readability (default: compact)",
+                    "default": False,
                 },
-                "required": [],
             },
-        ),
-        Tool(
-            name="delete_experiment",
-            description="Delete an experiment (soft-delete). The experiment will be marked as deleted but may be recoverable by an administrator. Use with caution!",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the experiment to delete",
-                    },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="list_experiment_categories",
+        description="List available experiment CATEGORIES from elabFTW. Categories are used to classify/organize experiments (e.g., 'PCR', 'Western Blot'). Use the returned 'id' as the 'category' parameter when creating or updating experiments. Note: This is DIFFERENT from templates.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "team_id": {
+                    "type": "integer",
+                    "description": "Team ID to get categories for (default: 1)",
+                    "default": 1,
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Re-read the list from the server instead of the cached copy (kept for a few minutes). Use after categories were changed in elabFTW.",
+                    "default": False,
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Indent the JSON output for readability (default: compact)",
+                    "default": False,
                 },
-                "required": ["experiment_id"],
             },
-        ),
-        Tool(
-            name="list_experiments",
-            description="List experiments from elabFTW. Returns a list of experiments with their basic info (ID, title, date, etc.). Supports pagination, search, and filtering by owner.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of experiments to return (default: 15, max: 100)",
-                        "default": 15,
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Number of experiments to skip for pagination (default: 0)",
-                        "default": 0,
-                    },
-                    "search": {
-                        "type": "string",
-                        "description": "Optional search query to filter experiments by title or content",
-                    },
-                    "owner": {
-                        "type": "string",
-                        "description": "Optional user ID(s) to filter experiments by owner. Can be a single ID like '2' or multiple comma-separated IDs like '2,3'",
-                    },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="delete_experiment",
+        description="Delete an experiment (soft-delete). The experiment will be marked as deleted but may be recoverable by an administrator. Use with caution!",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the experiment to delete",
                 },
-                "required": [],
             },
-        ),
-        Tool(
-            name="get_experiment",
-            description="Get detailed information about a specific experiment by its ID. Returns full experiment data including title, body, metadata, tags, etc.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the experiment to retrieve",
-                    },
+            "required": ["experiment_id"],
+        },
+    ),
+    Tool(
+        name="list_experiments",
+        description="List experiments from elabFTW. Returns a list of experiments with their basic info (ID, title, date, etc.). Supports pagination, search, and filtering by owner.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of experiments to return (default: 15, max: 100)",
+                    "default": 15,
+                    "minimum": 1,
+                    "maximum": 100,
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of experiments to skip for pagination (default: 0)",
+                    "default": 0,
+                },
+                "search": {
+                    "type": "string",
+                    "description": "Optional search query to filter experiments by title or content",
+                },
+                "owner": {
+                    "type": "string",
+                    "description": "Optional user ID(s) to filter experiments by owner. Can be a single ID like '2' or multiple comma-separated IDs like '2,3'",
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Indent the JSON output for readability (default: compact)",
+                    "default": False,
                 },
-                "required": ["experiment_id"],
             },
-        ),
-        Tool(
-            name="create_experiment",
-            description="Create a new experiment in elabFTW. The experiment will be created with the given title and optional body content. HTML formatting is supported in the body.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Title of the new experiment",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Body/content of the experiment. HTML formatting is supported.",
-                        "default": "",
-                    },
-                    "template": {
-                        "type": "integer",
-                        "description": "Template ID to use for the experiment structure (-1 for empty body, 0 for team template, or specific template ID). Use list_experiment_templates to see available templates. Required by some elabFTW instances. NOTE: This is different from 'category'!",
-                    },
-                    "category": {
-                        "type": "integer",
-                        "description": "Category ID to classify the experiment (e.g., PCR, Western Blot). Use list_experiment_categories to find valid category IDs. NOTE: This is different from 'template'!",
-                    },
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Optional list of tags to add to the experiment",
-                    },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_experiment",
+        description="Get detailed information about a specific experiment by its ID. Returns full experiment data including title, body, metadata, tags, etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the experiment to retrieve",
                 },
-                "required": ["title"],
             },
-        ),
-        Tool(
-            name="update_experiment",
-            description="Update an existing experiment. You can update the title, body, or category. At least one field must be provided.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the experiment to update",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "New title for the experiment",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "New body/content for the experiment. HTML formatting is supported.",
-                    },
-                    "category": {
-                        "type": "integer",
-                        "description": "New category ID for the experiment. Use list_experiment_categories to find valid IDs.",
-                    },
-                    "status": {
-                        "type": "integer",
-                        "description": "New status ID for the experiment.",
-                    },
+            "required": ["experiment_id"],
+        },
+    ),
+    Tool(
+        name="create_experiment",
+        description="Create a new experiment in elabFTW. The experiment will be created with the given title and optional body content. HTML formatting is supported in the body.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Title of the new experiment",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Body/content of the experiment. HTML formatting is supported.",
+                    "default": "",
+                },
+                "template": {
+                    "type": "integer",
+                    "description": "Template ID to use for the experiment structure (-1 for empty body, 0 for team template, or specific template ID). Use list_experiment_templates to see available templates. Required by some elabFTW instances. NOTE: This is different from 'category'!",
+                },
+                "category": {
+                    "type": "integer",
+                    "description": "Category ID to classify the experiment (e.g., PCR, Western Blot). Use list_experiment_categories to find valid category IDs. NOTE: This is different from 'template'!",
+                },
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional list of tags to add to the experiment",
                 },
-                "required": ["experiment_id"],
             },
-        ),
-        Tool(
-            name="add_tag",
-            description="Add a tag to an existing experiment.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the experiment",
-                    },
-                    "tag": {
-                        "type": "string",
-                        "description": "The tag to add to the experiment",
-                    },
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="create_experiment_guided",
+        description="Create a new experiment in one step: looks up the experiment templates and categories, picks the ones matching the given hints (ID or title, case-insensitive, partial titles allowed) and creates the experiment. Returns the available templates and categories together with the created experiment. Fails without creating anything if a hint matches nothing.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Title of the new experiment",
+                },
+                "template_hint": {
+                    "type": "string",
+                    "description": "Template ID or title (e.g., 'PCR protocol'). Omit to create without a template.",
+                },
+                "category_hint": {
+                    "type": "string",
+                    "description": "Category ID or title (e.g., 'Western Blot'). Omit to leave the experiment uncategorized.",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Body/content of the experiment. HTML formatting is supported.",
+                    "default": "",
+                },
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional list of tags to add to the experiment",
+                },
+                "team_id": {
+                    "type": "integer",
+                    "description": "Team whose categories are searched (default: 1)",
+                    "default": 1,
                 },
-                "required": ["experiment_id", "tag"],
             },
-        ),
-        Tool(
-            name="remove_tag",
-            description="Remove a tag from an existing experiment.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the experiment",
-                    },
-                    "tag_id": {
-                        "type": "integer",
-                        "description": "The ID of the tag to remove (can be found in experiment details)",
-                    },
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="update_experiment",
+        description="Update an existing experiment. You can update the title, body, or category. At least one field must be provided.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the experiment to update",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "New title for the experiment",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "New body/content for the experiment. HTML formatting is supported.",
+                },
+                "category": {
+                    "type": "integer",
+                    "description": "New category ID for the experiment. Use list_experiment_categories to find valid IDs.",
+                },
+                "status": {
+                    "type": "integer",
+                    "description": "New status ID for the experiment.",
                 },
-                "required": ["experiment_id", "tag_id"],
             },
-        ),
-        Tool(
-            name="set_experiment_status",
-            description="Set the status of an experiment (e.g., Running, Success, Need to be redone). Status IDs depend on your elabFTW configuration.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the experiment",
-                    },
-                    "status_id": {
-                        "type": "integer",
-                        "description": "The status ID to set (depends on your elabFTW configuration)",
-                    },
+            "required": ["experiment_id"],
+        },
+    ),
+    Tool(
+        name="add_tag",
+        description="Add a tag to an existing experiment.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the experiment",
+                },
+                "tag": {
+                    "type": "string",
+                    "description": "The tag to add to the experiment",
                 },
-                "required": ["experiment_id", "status_id"],
             },
-        ),
-        Tool(
-            name="link_item",
-            description="Link another experiment or database item to an experiment. Useful for creating relationships between entries.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the experiment to add the link to",
-                    },
-                    "link_id": {
-                        "type": "integer",
-                        "description": "The ID of the experiment or item to link",
-                    },
-                    "link_type": {
-                        "type": "string",
-                        "enum": ["experiments", "items"],
-                        "description": "Type of link: 'experiments' to link another experiment, 'items' to link a database item",
-                        "default": "experiments",
-                    },
+            "required": ["experiment_id", "tag"],
+        },
+    ),
+    Tool(
+        name="remove_tag",
+        description="Remove a tag from an existing experiment.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the experiment",
+                },
+                "tag_id": {
+                    "type": "integer",
+                    "description": "The ID of the tag to remove (can be found in experiment details)",
                 },
-                "required": ["experiment_id", "link_id"],
             },
-        ),
-        Tool(
-            name="upload_attachment",
-            description="Upload a file attachment to an experiment. The file must exist on the local filesystem.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the experiment",
-                    },
-                    "file_path": {
-                        "type": "string",
-                        "description": "The full path to the file to upload",
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Optional comment to attach to the uploaded file",
-                    },
+            "required": ["experiment_id", "tag_id"],
+        },
+    ),
+    Tool(
+        name="set_experiment_status",
+        description="Set the status of an experiment (e.g., Running, Success, Need to be redone). Status IDs depend on your elabFTW configuration.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the experiment",
+                },
+                "status_id": {
+                    "type": "integer",
+                    "description": "The status ID to set (depends on your elabFTW configuration)",
                 },
-                "required": ["experiment_id", "file_path"],
             },
-        ),
-        # ==================== ITEMS/RESOURCES TOOLS ====================
-        Tool(
-            name="list_items",
-            description="List database items (resources) from elabFTW. Items can be equipment, chemicals, cell lines, etc. Returns list with basic info. Supports filtering by owner.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of items to return (default: 15, max: 100)",
-                        "default": 15,
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Number of items to skip for pagination (default: 0)",
-                        "default": 0,
-                    },
-                    "search": {
-                        "type": "string",
-                        "description": "Optional search query to filter items by title or content",
-                    },
-                    "category": {
-                        "type": "integer",
-                        "description": "Optional category ID to filter items by type/category",
-                    },
-                    "owner": {
-                        "type": "string",
-                        "description": "Optional user ID(s) to filter items by owner. Can be a single ID like '2' or multiple comma-separated IDs like '2,3'",
-                    },
+            "required": ["experiment_id", "status_id"],
+        },
+    ),
+    Tool(
+        name="link_item",
+        description="Link another experiment or database item to an experiment. Useful for creating relationships between entries.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the experiment to add the link to",
+                },
+                "link_id": {
+                    "type": "integer",
+                    "description": "The ID of the experiment or item to link",
+                },
+                "link_type": {
+                    "type": "string",
+                    "enum": ["experiments", "items"],
+                    "description": "Type of link: 'experiments' to link another experiment, 'items' to link a database item",
+                    "default": "experiments",
                 },
-                "required": [],
             },
-        ),
-        Tool(
-            name="get_item",
-            description="Get detailed information about a specific database item (resource) by its ID. Returns full item data including title, body, metadata, tags, linked items, etc.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the item to retrieve",
-                    },
+            "required": ["experiment_id", "link_id"],
+        },
+    ),
+    Tool(
+        name="upload_attachment",
+        description="Upload a file attachment to an experiment. The file must exist on the local filesystem.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the experiment",
+                },
+                "file_path": {
+                    "type": "string",
+                    "description": "The full path to the file to upload",
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Optional comment to attach to the uploaded file",
                 },
-                "required": ["item_id"],
             },
-        ),
-        Tool(
-            name="create_item",
-            description="Create a new database item (resource) in elabFTW. Use this to add chemicals, equipment, setups, reagents, etc. to your lab inventory.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "integer",
-                        "description": "Category/type ID for the item (REQUIRED). Use list_items_types to find valid IDs (e.g., Chemicals, Equipment, Setups).",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Title of the new item (e.g., chemical name, equipment name)",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Body/content of the item. HTML formatting is supported. Can include specifications, notes, safety info, etc.",
-                        "default": "",
-                    },
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Optional list of tags to add to the item",
-                    },
+            "required": ["experiment_id", "file_path"],
+        },
+    ),
+    # ==================== ITEMS/RESOURCES TOOLS ====================
+    Tool(
+        name="list_items",
+        description="List database items (resources) from elabFTW. Items can be equipment, chemicals, cell lines, etc. Returns list with basic info. Supports filtering by owner.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of items to return (default: 15, max: 100)",
+                    "default": 15,
+                    "minimum": 1,
+                    "maximum": 100,
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of items to skip for pagination (default: 0)",
+                    "default": 0,
+                },
+                "search": {
+                    "type": "string",
+                    "description": "Optional search query to filter items by title or content",
+                },
+                "category": {
+                    "type": "integer",
+                    "description": "Optional category ID to filter items by type/category",
+                },
+                "owner": {
+                    "type": "string",
+                    "description": "Optional user ID(s) to filter items by owner. Can be a single ID like '2' or multiple comma-separated IDs like '2,3'",
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Indent the JSON output for readability (default: compact)",
+                    "default": False,
                 },
-                "required": ["category"],
             },
-        ),
-        Tool(
-            name="update_item",
-            description="Update an existing database item (resource). You can update the title, body, category, or rating.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the item to update",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "New title for the item",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "New body/content for the item. HTML formatting is supported.",
-                    },
-                    "category": {
-                        "type": "integer",
-                        "description": "New category/type ID for the item. Use list_items_types to find valid IDs.",
-                    },
-                    "rating": {
-                        "type": "integer",
-                        "description": "Rating for the item (0-5). Useful for rating reagent quality, equipment reliability, etc.",
-                    },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_item",
+        description="Get detailed information about a specific database item (resource) by its ID. Returns full item data including title, body, metadata, tags, linked items, etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the item to retrieve",
                 },
-                "required": ["item_id"],
             },
-        ),
-        Tool(
-            name="delete_item",
-            description="Delete a database item (soft-delete). The item will be marked as deleted but may be recoverable by an administrator. Use with caution!",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the item to delete",
-                    },
+            "required": ["item_id"],
+        },
+    ),
+    Tool(
+        name="create_item",
+        description="Create a new database item (resource) in elabFTW. Use this to add chemicals, equipment, setups, reagents, etc. to your lab inventory.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "integer",
+                    "description": "Category/type ID for the item (REQUIRED). Use list_items_types to find valid IDs (e.g., Chemicals, Equipment, Setups).",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Title of the new item (e.g., chemical name, equipment name)",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Body/content of the item. HTML formatting is supported. Can include specifications, notes, safety info, etc.",
+                    "default": "",
+                },
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional list of tags to add to the item",
                 },
-                "required": ["item_id"],
             },
-        ),
-        Tool(
-            name="list_items_types",
-            description="List available item types/categories for database items. Item types define what kinds of resources you can store (e.g., Chemicals, Equipment, Plasmids, Cell Lines, Setups). Use the returned 'id' as the 'category' parameter when creating or filtering items.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "team_id": {
-                        "type": "integer",
-                        "description": "Team ID to get item types for (default: 1)",
-                        "default": 1,
-                    },
+            "required": ["category"],
+        },
+    ),
+    Tool(
+        name="update_item",
+        description="Update an existing database item (resource). You can update the title, body, category, or rating.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the item to update",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "New title for the item",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "New body/content for the item. HTML formatting is supported.",
+                },
+                "category": {
+                    "type": "integer",
+                    "description": "New category/type ID for the item. Use list_items_types to find valid IDs.",
+                },
+                "rating": {
+                    "type": "integer",
+                    "description": "Rating for the item (0-5). Useful for rating reagent quality, equipment reliability, etc.",
                 },
-                "required": [],
             },
-        ),
-        Tool(
-            name="add_item_tag",
-            description="Add a tag to an existing database item.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the item",
-                    },
-                    "tag": {
-                        "type": "string",
-                        "description": "The tag to add to the item",
-                    },
+            "required": ["item_id"],
+        },
+    ),
+    Tool(
+        name="delete_item",
+        description="Delete a database item (soft-delete). The item will be marked as deleted but may be recoverable by an administrator. Use with caution!",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the item to delete",
                 },
-                "required": ["item_id", "tag"],
             },
-        ),
-        Tool(
-            name="remove_item_tag",
-            description="Remove a tag from an existing database item.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the item",
-                    },
-                    "tag_id": {
-                        "type": "integer",
-                        "description": "The ID of the tag to remove (can be found in item details)",
-                    },
+            "required": ["item_id"],
+        },
+    ),
+    Tool(
+        name="list_items_types",
+        description="List available item types/categories for database items. Item types define what kinds of resources you can store (e.g., Chemicals, Equipment, Plasmids, Cell Lines, Setups). Use the returned 'id' as the 'category' parameter when creating or filtering items.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "team_id": {
+                    "type": "integer",
+                    "description": "Team ID to get item types for (default: 1)",
+                    "default": 1,
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Re-read the list from the server instead of the cached copy (kept for a few minutes). Use after item types were changed in elabFTW.",
+                    "default": False,
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Indent the JSON output for readability (default: compact)",
+                    "default": False,
                 },
-                "required": ["item_id", "tag_id"],
             },
-        ),
-        Tool(
-            name="upload_item_attachment",
-            description="Upload a file attachment to a database item. Useful for attaching datasheets, manuals, certificates, etc.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the item",
-                    },
-                    "file_path": {
-                        "type": "string",
-                        "description": "The full path to the file to upload",
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Optional comment to attach to the uploaded file",
-                    },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="add_item_tag",
+        description="Add a tag to an existing database item.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the item",
+                },
+                "tag": {
+                    "type": "string",
+                    "description": "The tag to add to the item",
                 },
-                "required": ["item_id", "file_path"],
             },
-        ),
-        Tool(
-            name="link_to_item",
-            description="Link another item or experiment to a database item. Useful for connecting related resources (e.g., linking a chemical to the equipment it's used with).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the item to add the link to",
-                    },
-                    "link_id": {
-                        "type": "integer",
-                        "description": "The ID of the item or experiment to link",
-                    },
-                    "link_type": {
-                        "type": "string",
-                        "enum": ["items", "experiments"],
-                        "description": "Type of link: 'items' to link another database item, 'experiments' to link an experiment",
-                        "default": "items",
-                    },
+            "required": ["item_id", "tag"],
+        },
+    ),
+    Tool(
+        name="remove_item_tag",
+        description="Remove a tag from an existing database item.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the item",
+                },
+                "tag_id": {
+                    "type": "integer",
+                    "description": "The ID of the tag to remove (can be found in item details)",
                 },
-                "required": ["item_id", "link_id"],
             },
-        ),
-        # ==================== BOOKING/EVENTS TOOLS ====================
-        Tool(
-            name="list_bookings",
-            description="List booking events/reservations for equipment and setups. Shows scheduled use of bookable items. Returns event details including item, user, time, and duration.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of bookings to return (default: 50)",
-                        "default": 50,
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Number of bookings to skip for pagination (default: 0)",
-                        "default": 0,
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "Filter bookings starting after this datetime (ISO format: 2024-01-15T09:00:00)",
-                    },
-                    "end": {
-                        "type": "string",
-                        "description": "Filter bookings ending before this datetime (ISO format: 2024-01-15T17:00:00)",
-                    },
-                    "item_id": {
-                        "type": "integer",
-                        "description": "Filter bookings for a specific item/equipment",
-                    },
+            "required": ["item_id", "tag_id"],
+        },
+    ),
+    Tool(
+        name="upload_item_attachment",
+        description="Upload a file attachment to a database item. Useful for attaching datasheets, manuals, certificates, etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the item",
+                },
+                "file_path": {
+                    "type": "string",
+                    "description": "The full path to the file to upload",
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Optional comment to attach to the uploaded file",
                 },
-                "required": [],
             },
-        ),
-        Tool(
-            name="get_booking",
-            description="Get detailed information about a specific booking by its ID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "event_id": {
-                        "type": "integer",
-                        "description": "The unique ID of the booking/event",
-                    },
+            "required": ["item_id", "file_path"],
+        },
+    ),
+    Tool(
+        name="link_to_item",
+        description="Link another item or experiment to a database item. Useful for connecting related resources (e.g., linking a chemical to the equipment it's used with).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the item to add the link to",
+                },
+                "link_id": {
+                    "type": "integer",
+                    "description": "The ID of the item or experiment to link",
+                },
+                "link_type": {
+                    "type": "string",
+                    "enum": ["items", "experiments"],
+                    "description": "Type of link: 'items' to link another database item, 'experiments' to link an experiment",
+                    "default": "items",
                 },
-                "required": ["event_id"],
             },
-        ),
-        Tool(
-            name="create_booking",
-            description="Book/reserve an item (equipment, setup, etc.) for a specific time period. The item must have is_bookable=1. Use list_items to find bookable items.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The ID of the item to book (must be bookable)",
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "Start datetime in ISO 8601 format (e.g., '2024-01-15T09:00:00' or '2024-01-15T09:00:00+01:00')",
-                    },
-                    "end": {
-                        "type": "string",
-                        "description": "End datetime in ISO 8601 format (e.g., '2024-01-15T17:00:00' or '2024-01-15T17:00:00+01:00')",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Optional title/description for the booking (e.g., 'Sample preparation experiment')",
-                    },
+            "required": ["item_id", "link_id"],
+        },
+    ),
+    # ==================== BOOKING/EVENTS TOOLS ====================
+    Tool(
+        name="list_bookings",
+        description="List booking events/reservations for equipment and setups. Shows scheduled use of bookable items. Returns event details including item, user, time, and duration.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of bookings to return (default: 50, max: 100)",
+                    "default": 50,
+                    "minimum": 1,
+                    "maximum": 100,
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of bookings to skip for pagination (default: 0)",
+                    "default": 0,
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Filter bookings starting after this datetime (ISO format: 2024-01-15T09:00:00)",
+                },
+                "end": {
+                    "type": "string",
+                    "description": "Filter bookings ending before this datetime (ISO format: 2024-01-15T17:00:00). A bare date like 2024-01-15 includes that whole day.",
+                },
+                "item_id": {
+                    "type": "integer",
+                    "description": "Filter bookings for a specific item/equipment",
+                },
+                "after": {
+                    "type": "string",
+                    "description": "Cursor for the next page, as returned at the end of the previous list_bookings result. Use instead of offset when paging through long schedules.",
+                    "pattern": r"^.+\|\d+$",
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Indent the JSON output for readability (default: compact)",
+                    "default": False,
                 },
-                "required": ["item_id", "start", "end"],
             },
-        ),
-        Tool(
-            name="update_booking",
-            description="Update an existing booking (change time or title). Only the booking creator or admins can modify bookings. Subject to cancellation policies.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "event_id": {
-                        "type": "integer",
-                        "description": "The ID of the booking to update",
-                    },
-                    "start": {
-                        "type": "string",
-                        "description": "New start datetime in ISO 8601 format",
-                    },
-                    "end": {
-                        "type": "string",
-                        "description": "New end datetime in ISO 8601 format",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "New title for the booking",
-                    },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_booking",
+        description="Get detailed information about a specific booking by its ID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "event_id": {
+                    "type": "integer",
+                    "description": "The unique ID of the booking/event",
                 },
-                "required": ["event_id"],
             },
-        ),
-        Tool(
-            name="cancel_booking",
-            description="Cancel/delete a booking. Permissions and cancellation policies (book_is_cancellable, book_cancel_minutes) may apply. Only the booking creator or admins can cancel.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "event_id": {
-                        "type": "integer",
-                        "description": "The ID of the booking to cancel",
-                    },
+            "required": ["event_id"],
+        },
+    ),
+    Tool(
+        name="create_booking",
+        description="Book/reserve an item (equipment, setup, etc.) for a specific time period. The item must have is_bookable=1. Use list_items to find bookable items.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The ID of the item to book (must be bookable)",
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Start datetime in ISO 8601 format (e.g., '2024-01-15T09:00:00' or '2024-01-15T09:00:00+01:00')",
+                },
+                "end": {
+                    "type": "string",
+                    "description": "End datetime in ISO 8601 format (e.g., '2024-01-15T17:00:00' or '2024-01-15T17:00:00+01:00')",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Optional title/description for the booking (e.g., 'Sample preparation experiment')",
                 },
-                "required": ["event_id"],
             },
-        ),
-        Tool(
-            name="get_bookable_items",
-            description="List all items that can be booked (is_bookable=1) with their booking settings like max duration, overlap rules, and cancellation policies. Use this to find what equipment/setups are available for booking.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of items to return (default: 50)",
-                        "default": 50,
+            "required": ["item_id", "start", "end"],
+        },
+    ),
+    Tool(
+        name="create_bookings_bulk",
+        description="Book several time slots in one call (e.g. a recurring measurement series). The bookings are sent concurrently; each entry in the result is either the created booking or an error for that slot.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "bookings": {
+                    "type": "array",
+                    "description": "List of bookings to create (1 to 100)",
+                    "minItems": 1,
+                    "maxItems": 100,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "item_id": {
+                                "type": "integer",
+                                "description": "The ID of the item to book (must be bookable)",
+                            },
+                            "start": {
+                                "type": "string",
+                                "description": "Start datetime in ISO 8601 format",
+                            },
+                            "end": {
+                                "type": "string",
+                                "description": "End datetime in ISO 8601 format",
+                            },
+                            "title": {
+                                "type": "string",
+                                "description": "Optional title for the booking",
+                            },
+                        },
+                        "required": ["item_id", "start", "end"],
                     },
                 },
-                "required": [],
             },
-        ),
-        # ==================== UPLOAD LISTING TOOLS ====================
-        Tool(
-            name="list_experiment_uploads",
-            description="List all file attachments on an experiment, including filename, size, uploader, upload date, and a download URL. Use this to discover what files are attached before downloading or referencing them.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The ID of the experiment",
-                    },
+            "required": ["bookings"],
+        },
+    ),
+    Tool(
+        name="update_booking",
+        description="Update an existing booking (change time or title). Only the booking creator or admins can modify bookings. Subject to cancellation policies.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "event_id": {
+                    "type": "integer",
+                    "description": "The ID of the booking to update",
+                },
+                "start": {
+                    "type": "string",
+                    "description": "New start datetime in ISO 8601 format",
+                },
+                "end": {
+                    "type": "string",
+                    "description": "New end datetime in ISO 8601 format",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "New title for the booking",
                 },
-                "required": ["experiment_id"],
             },
-        ),
-        Tool(
-            name="list_item_uploads",
-            description="List all file attachments on a database item (chemical, device, etc.), including filename, size, uploader, upload date, and a download URL.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The ID of the database item",
-                    },
+            "required": ["event_id"],
+        },
+    ),
+    Tool(
+        name="cancel_booking",
+        description="Cancel/delete a booking. Permissions and cancellation policies (book_is_cancellable, book_cancel_minutes) may apply. Only the booking creator or admins can cancel.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "event_id": {
+                    "type": "integer",
+                    "description": "The ID of the booking to cancel",
                 },
-                "required": ["item_id"],
             },
-        ),
-        # ==================== STEPS TOOLS ====================
-        Tool(
-            name="add_experiment_step",
-            description="Add a checklist step or TODO task to an experiment. Steps appear as a checklist in the experiment entry. Useful for tracking protocol steps or action items.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The ID of the experiment",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Text of the step (e.g. 'Calibrate instrument before measurement')",
-                    },
+            "required": ["event_id"],
+        },
+    ),
+    Tool(
+        name="get_bookable_items",
+        description="List all items that can be booked (is_bookable=1) with their booking settings like max duration, overlap rules, and cancellation policies. Use this to find what equipment/setups are available for booking. Items are scanned 100 per request (at most the first 2000 items), so large databases with few bookable items take several requests.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of items to return (default: 50)",
+                    "default": 50,
+                    "minimum": 1,
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Indent the JSON output for readability (default: compact)",
+                    "default": False,
                 },
-                "required": ["experiment_id", "body"],
             },
-        ),
-        Tool(
-            name="update_experiment_step",
-            description="Update the text of an existing experiment step. Get step IDs from the 'steps' field in get_experiment.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The ID of the experiment",
-                    },
-                    "step_id": {
-                        "type": "integer",
-                        "description": "The ID of the step to update (from get_experiment 'steps' field)",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "New text for the step",
-                    },
+            "required": [],
+        },
+    ),
+    # ==================== UPLOAD LISTING TOOLS ====================
+    Tool(
+        name="list_experiment_uploads",
+        description="List all file attachments on an experiment, including filename, size, uploader, upload date, and a download URL. Use this to discover what files are attached before downloading or referencing them.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The ID of the experiment",
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Indent the JSON output for readability (default: compact)",
+                    "default": False,
                 },
-                "required": ["experiment_id", "step_id", "body"],
             },
-        ),
-        Tool(
-            name="delete_experiment_step",
-            description="Delete a step from an experiment. Get step IDs from the 'steps' field in get_experiment.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The ID of the experiment",
-                    },
-                    "step_id": {
-                        "type": "integer",
-                        "description": "The ID of the step to delete",
-                    },
+            "required": ["experiment_id"],
+        },
+    ),
+    Tool(
+        name="list_item_uploads",
+        description="List all file attachments on a database item (chemical, device, etc.), including filename, size, uploader, upload date, and a download URL.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The ID of the database item",
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Indent the JSON output for readability (default: compact)",
+                    "default": False,
                 },
-                "required": ["experiment_id", "step_id"],
             },
-        ),
-        Tool(
-            name="add_item_step",
-            description="Add a checklist step or maintenance task to a database item (e.g. equipment). Useful for service checklists or usage instructions.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The ID of the database item",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Text of the step (e.g. 'Clean optical surfaces with IPA before use')",
-                    },
+            "required": ["item_id"],
+        },
+    ),
+    # ==================== STEPS TOOLS ====================
+    Tool(
+        name="add_experiment_step",
+        description="Add a checklist step or TODO task to an experiment. Steps appear as a checklist in the experiment entry. Useful for tracking protocol steps or action items.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The ID of the experiment",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Text of the step (e.g. 'Calibrate instrument before measurement')",
                 },
-                "required": ["item_id", "body"],
             },
-        ),
-        Tool(
-            name="update_item_step",
-            description="Update the text of an existing item step. Get step IDs from the 'steps' field in get_item.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The ID of the database item",
-                    },
-                    "step_id": {
-                        "type": "integer",
-                        "description": "The ID of the step to update",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "New text for the step",
-                    },
+            "required": ["experiment_id", "body"],
+        },
+    ),
+    Tool(
+        name="update_experiment_step",
+        description="Update the text of an existing experiment step. Get step IDs from the 'steps' field in get_experiment.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The ID of the experiment",
+                },
+                "step_id": {
+                    "type": "integer",
+                    "description": "The ID of the step to update (from get_experiment 'steps' field)",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "New text for the step",
                 },
-                "required": ["item_id", "step_id", "body"],
             },
-        ),
-        Tool(
-            name="delete_item_step",
-            description="Delete a step from a database item. Get step IDs from the 'steps' field in get_item.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The ID of the database item",
-                    },
-                    "step_id": {
-                        "type": "integer",
-                        "description": "The ID of the step to delete",
-                    },
+            "required": ["experiment_id", "step_id", "body"],
+        },
+    ),
+    Tool(
+        name="delete_experiment_step",
+        description="Delete a step from an experiment. Get step IDs from the 'steps' field in get_experiment.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The ID of the experiment",
+                },
+                "step_id": {
+                    "type": "integer",
+                    "description": "The ID of the step to delete",
                 },
-                "required": ["item_id", "step_id"],
             },
-        ),
-        # ==================== COMMENTS TOOLS ====================
-        Tool(
-            name="list_experiment_comments",
-            description="List all comments on an experiment, including author, date, and comment text. Use the returned 'id' field when deleting a comment.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The ID of the experiment",
-                    },
+            "required": ["experiment_id", "step_id"],
+        },
+    ),
+    Tool(
+        name="add_item_step",
+        description="Add a checklist step or maintenance task to a database item (e.g. equipment). Useful for service checklists or usage instructions.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The ID of the database item",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Text of the step (e.g. 'Clean optical surfaces with IPA before use')",
                 },
-                "required": ["experiment_id"],
             },
-        ),
-        Tool(
-            name="add_experiment_comment",
-            description="Add a text comment to an experiment. Comments appear in a discussion thread below the experiment entry.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The ID of the experiment",
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "The comment text to add",
-                    },
+            "required": ["item_id", "body"],
+        },
+    ),
+    Tool(
+        name="update_item_step",
+        description="Update the text of an existing item step. Get step IDs from the 'steps' field in get_item.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The ID of the database item",
+                },
+                "step_id": {
+                    "type": "integer",
+                    "description": "The ID of the step to update",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "New text for the step",
                 },
-                "required": ["experiment_id", "comment"],
             },
-        ),
-        Tool(
-            name="delete_experiment_comment",
-            description="Delete a comment from an experiment. Use list_experiment_comments to get the comment 'id' first.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "experiment_id": {
-                        "type": "integer",
-                        "description": "The ID of the experiment",
-                    },
-                    "comment_id": {
-                        "type": "integer",
-                        "description": "The ID of the comment to delete (from list_experiment_comments)",
-                    },
+            "required": ["item_id", "step_id", "body"],
+        },
+    ),
+    Tool(
+        name="delete_item_step",
+        description="Delete a step from a database item. Get step IDs from the 'steps' field in get_item.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The ID of the database item",
+                },
+                "step_id": {
+                    "type": "integer",
+                    "description": "The ID of the step to delete",
                 },
-                "required": ["experiment_id", "comment_id"],
             },
-        ),
-        Tool(
-            name="list_item_comments",
-            description="List all comments on a database item, including author, date, and comment text. Use the returned 'id' field when deleting a comment.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The ID of the database item",
-                    },
+            "required": ["item_id", "step_id"],
+        },
+    ),
+    # ==================== COMMENTS TOOLS ====================
+    Tool(
+        name="list_experiment_comments",
+        description="List all comments on an experiment, including author, date, and comment text. Use the returned 'id' field when deleting a comment.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The ID of the experiment",
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Indent the JSON output for readability (default: compact)",
+                    "default": False,
                 },
-                "required": ["item_id"],
             },
-        ),
-        Tool(
-            name="add_item_comment",
-            description="Add a text comment to a database item (chemical, device, etc.). Useful for lab notes, observations, or collaborative annotations.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The ID of the database item",
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "The comment text to add",
-                    },
+            "required": ["experiment_id"],
+        },
+    ),
+    Tool(
+        name="add_experiment_comment",
+        description="Add a text comment to an experiment. Comments appear in a discussion thread below the experiment entry.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The ID of the experiment",
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "The comment text to add",
                 },
-                "required": ["item_id", "comment"],
             },
-        ),
-        Tool(
-            name="delete_item_comment",
-            description="Delete a comment from a database item. Use list_item_comments to get the comment 'id' first.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "integer",
-                        "description": "The ID of the database item",
-                    },
-                    "comment_id": {
-                        "type": "integer",
-                        "description": "The ID of the comment to delete (from list_item_comments)",
-                    },
+            "required": ["experiment_id", "comment"],
+        },
+    ),
+    Tool(
+        name="delete_experiment_comment",
+        description="Delete a comment from an experiment. Use list_experiment_comments to get the comment 'id' first.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "experiment_id": {
+                    "type": "integer",
+                    "description": "The ID of the experiment",
+                },
+                "comment_id": {
+                    "type": "integer",
+                    "description": "The ID of the comment to delete (from list_experiment_comments)",
                 },
-                "required": ["item_id", "comment_id"],
             },
-        ),
-        # ==================== PUBCHEM TOOLS ====================
-        Tool(
-            name="lookup_pubchem",
-            description="Look up a chemical compound on PubChem by name, CAS number (e.g. '81-88-9'), or InChIKey. Returns molecular formula, weight, IUPAC name, SMILES, InChIKey, and LogP. Use this before creating a Chemical item to verify the compound and get its properties.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "identifier": {
-                        "type": "string",
-                        "description": "Compound name (e.g. 'Rhodamine B'), CAS number (e.g. '81-88-9'), or InChIKey",
-                    },
+            "required": ["experiment_id", "comment_id"],
+        },
+    ),
+    Tool(
+        name="list_item_comments",
+        description="List all comments on a database item, including author, date, and comment text. Use the returned 'id' field when deleting a comment.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The ID of the database item",
+                },
+                "pretty": {
+                    "type": "boolean",
+                    "description": "Indent the JSON output for readability (default: compact)",
+                    "default": False,
                 },
-                "required": ["identifier"],
             },
-        ),
-        Tool(
-            name="create_chemical_from_pubchem",
-            description="Look up a compound on PubChem and automatically create a Chemical database item pre-filled with molecular formula, weight, IUPAC name, SMILES, InChIKey, and a PubChem link. Leaves supplier/lot/storage fields blank for manual completion. Use list_items_types to find the correct category_id for 'Chemicals'.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "identifier": {
-                        "type": "string",
-                        "description": "Compound name, CAS number, or InChIKey to look up on PubChem",
-                    },
-                    "category_id": {
-                        "type": "integer",
-                        "description": "Item category ID for Chemicals. Use list_items_types to find it.",
-                    },
-                    "additional_notes": {
-                        "type": "string",
-                        "description": "Optional extra text to append (e.g. specific lab usage notes)",
-                    },
+            "required": ["item_id"],
+        },
+    ),
+    Tool(
+        name="add_item_comment",
+        description="Add a text comment to a database item (chemical, device, etc.). Useful for lab notes, observations, or collaborative annotations.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The ID of the database item",
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "The comment text to add",
                 },
-                "required": ["identifier", "category_id"],
             },
-        ),
+            "required": ["item_id", "comment"],
+        },
+    ),
+    Tool(
+        name="delete_item_comment",
+        description="Delete a comment from a database item. Use list_item_comments to get the comment 'id' first.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "item_id": {
+                    "type": "integer",
+                    "description": "The ID of the database item",
+                },
+                "comment_id": {
+                    "type": "integer",
+                    "description": "The ID of the comment to delete (from list_item_comments)",
+                },
+            },
+            "required": ["item_id", "comment_id"],
+        },
+    ),
+    # ==================== PUBCHEM TOOLS ====================
+    Tool(
+        name="lookup_pubchem",
+        description="Look up a chemical compound on PubChem by name, CAS number (e.g. '81-88-9'), or InChIKey. Returns molecular formula, weight, IUPAC name, SMILES, InChIKey, and LogP. Use this before creating a Chemical item to verify the compound and get its properties.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "identifier": {
+                    "type": "string",
+                    "description": "Compound name (e.g. 'Rhodamine B'), CAS number (e.g. '81-88-9'), or InChIKey",
+                },
+            },
+            "required": ["identifier"],
+        },
+    ),
+    Tool(
+        name="create_chemical_from_pubchem",
+        description="Look up a compound on PubChem and automatically create a Chemical database item pre-filled with molecular formula, weight, IUPAC name, SMILES, InChIKey, and a PubChem link. Leaves supplier/lot/storage fields blank for manual completion. Use list_items_types to find the correct category_id for 'Chemicals'.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "identifier": {
+                    "type": "string",
+                    "description": "Compound name, CAS number, or InChIKey to look up on PubChem",
+                },
+                "category_id": {
+                    "type": "integer",
+                    "description": "Item category ID for Chemicals. Use list_items_types to find it.",
+                },
+                "additional_notes": {
+                    "type": "string",
+                    "description": "Optional extra text to append (e.g. specific lab usage notes)",
+                },
+            },
+            "required": ["identifier", "category_id"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools for elabFTW interactions."""
+    return TOOLS
+
+
+# One validator per tool, built once: jsonschema.validate() would re-check the
+# schema itself and look up the validator class on every call
+_INPUT_VALIDATORS: dict[str, jsonschema.Draft202012Validator] = {
+    tool.name: jsonschema.Draft202012Validator(tool.inputSchema) for tool in TOOLS
+}
+
+
+# Event fields used by the list_bookings summary
+_BOOKING_FIELDS = (
+    "id",
+    "title",
+    "items_id",
+    "item_title",
+    "start",
+    "end",
+    "fullname",
+    "userid",
+    "event_duration_minutes",
+    "book_is_cancellable",
+)
+# Output keys of the summary, positionally matching _BOOKING_FIELDS
+_BOOKING_OUT = (
+    "id",
+    "title",
+    "item_id",
+    "item_title",
+    "start",
+    "end",
+    "user",
+    "user_id",
+    "duration_minutes",
+    "is_cancellable",
+)
+
+
+def _projector(
+    fields: dict[str, str],
+) -> Callable[[list[dict[str, Any]]], list[dict[str, Any]]]:
+    """
+    Build a function projecting API rows onto summary dicts.
+
+    fields maps each output key to the API field it is read from. Rows are
+    read with one C-level itemgetter call; if some row lacks a field, the
+    rows are projected with .get() instead so the gaps become None.
+    """
+    keys = tuple(fields)
+    getter = itemgetter(*fields.values())
+
+    def project(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        try:
+            return [dict(zip(keys, getter(row))) for row in rows]
+        except KeyError:
+            return [{key: row.get(f) for key, f in fields.items()} for row in rows]
+
+    return project
+
+
+_booking_summaries = _projector(dict(zip(_BOOKING_OUT, _BOOKING_FIELDS)))
+_experiment_summaries = _projector(
+    {
+        "id": "id",
+        "title": "title",
+        "created_at": "created_at",
+        "modified_at": "modified_at",
+        "category": "category",
+        "status": "status",
+        "owner": "userid",
+        "owner_name": "fullname",
+    }
+)
+_item_summaries = _projector(
+    {
+        "id": "id",
+        "title": "title",
+        "category": "category",
+        "category_title": "category_title",
+        "created_at": "created_at",
+        "modified_at": "modified_at",
+        "rating": "rating",
+        "owner": "userid",
+        "owner_name": "fullname",
+    }
+)
+_template_summaries = _projector(
+    {
+        "id": "id",
+        "title": "title",
+        "created_at": "created_at",
+        "modified_at": "modified_at",
+    }
+)
+_category_summaries = _projector(
+    {"id": "id", "title": "title", "color": "color", "is_default": "is_default"}
+)
+_upload_summaries = _projector(
+    {
+        "id": "id",
+        "filename": "real_name",
+        "size_bytes": "filesize",
+        "uploaded_by": "fullname",
+        "uploaded_at": "created_at",
+        "comment": "comment",
+        "hash_sha256": "hash",
+        "download_url": "download_url",
+    }
+)
+
+
+def _item_type_summaries(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Summarize item types, shortening the body to a 100 character preview."""
+    summaries = []
+    for item_type in rows:
+        body = item_type.get("body") or ""
+        summaries.append(
+            {
+                "id": item_type.get("id"),
+                "title": item_type.get("title"),
+                "color": item_type.get("color"),
+                "body": body[:100] + "..." if len(body) > 100 else body,
+            }
+        )
+    return summaries
+
+
+def _listing(
+    result: Any,
+    project: Callable[[list[dict[str, Any]]], list[dict[str, Any]]],
+    noun: str,
+    footer: str = "",
+    pretty: bool = False,
+) -> list[TextContent]:
+    """
+    Format a list reply as "Found N <noun>:" followed by the projected rows.
+
+    Anything other than a list (the API answered with an object) is shown
+    as returned.
+    """
+    if not isinstance(result, list):
+        return [TextContent(type="text", text=_dumps(result, pretty))]
+    rows = project(result)
+    return [
+        TextContent(
+            type="text",
+            text=f"Found {len(rows)} {noun}:\n\n{_dumps(rows, pretty)}{footer}",
+        )
+    ]
+
+
+def _parse_iso(value: str, field: str = "datetime") -> datetime:
+    """
+    Parse an ISO 8601 datetime, raising ValueError with a clear message.
+
+    Used to reject malformed booking times before they are sent to the server.
+    """
+    try:
+        # datetime.fromisoformat() only accepts a "Z" suffix from Python 3.11
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        raise ValueError(
+            f"Invalid {field} {value!r}: expected ISO 8601 format, "
+            "e.g. '2024-01-15T09:00:00' or '2024-01-15T09:00:00+01:00'"
+        ) from None
+
+
+def _check_booking_range(start: datetime, end: datetime) -> None:
+    """Raise ValueError unless start is strictly before end."""
+    try:
+        ordered = start < end
+    except TypeError:
+        raise ValueError(
+            "start and end must both include a UTC offset or both omit it"
+        ) from None
+    if not ordered:
+        raise ValueError(
+            f"start ({start.isoformat()}) must be before end ({end.isoformat()})"
+        )
+
+
+def _iso_half_open(
+    start: Optional[str], end: Optional[str]
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Normalize a date/time range to a half-open [start, end) interval.
+
+    A bare date as the end bound means "through that whole day", so it is
+    turned into midnight of the following day instead of being compared via
+    date truncation. A bare date as the start bound becomes its midnight.
+    Full datetimes are passed through unchanged.
+    """
+
+    def is_date(value: str) -> bool:
+        try:
+            date.fromisoformat(value)
+        except ValueError:
+            return False
+        return True
+
+    if start and is_date(start):
+        start = f"{start}T00:00:00"
+    if end and is_date(end):
+        end = f"{date.fromisoformat(end) + timedelta(days=1)}T00:00:00"
+    return start, end
+
+
+def _event_cursor(event: dict[str, Any]) -> str:
+    """Build the list_events 'after' cursor for an event."""
+    return f"{event.get('start')}|{event.get('id')}"
+
+
+def _bookable_info(item: dict[str, Any]) -> dict[str, Any]:
+    """Summarize the booking settings of a bookable item."""
+    return {
+        "id": item.get("id"),
+        "title": item.get("title"),
+        "category": item.get("category_title"),
+        "max_duration_minutes": item.get("book_max_minutes") or "unlimited",
+        "max_concurrent_slots": item.get("book_max_slots") or "unlimited",
+        "can_overlap": bool(item.get("book_can_overlap")),
+        "is_cancellable": bool(item.get("book_is_cancellable")),
+        "cancel_advance_minutes": item.get("book_cancel_minutes"),
+        "can_book_in_past": bool(item.get("book_users_can_in_past")),
+    }
+
+
+# ==================== EXPERIMENT HANDLERS ====================
+
+
+def _handle_list_experiment_templates(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    limit = arguments.get("limit", 15)
+    offset = arguments.get("offset", 0)
+
+    result = client.list_experiment_templates(
+        limit=limit,
+        offset=offset,
+        refresh=arguments.get("refresh", False),
+    )
+
+    return _listing(
+        result,
+        _template_summaries,
+        "experiment TEMPLATES",
+        "\n\nUse the 'id' as the 'template' parameter when creating a new experiment."
+        "\n\nNOTE: Templates define experiment structure. For classification "
+        "categories, use list_experiment_categories instead.",
+        pretty=arguments.get("pretty", False),
+    )
+
+
+def _handle_list_experiment_categories(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    team_id = arguments.get("team_id", 1)
+
+    result = client.list_experiment_categories(
+        team_id=team_id, refresh=arguments.get("refresh", False)
+    )
+
+    return _listing(
+        result,
+        _category_summaries,
+        "experiment CATEGORIES",
+        "\n\nUse the 'id' as the 'category' parameter when creating or updating "
+        "experiments.\n\nNOTE: Categories classify experiments. For experiment "
+        "structure/templates, use list_experiment_templates instead.",
+        pretty=arguments.get("pretty", False),
+    )
+
+
+def _handle_delete_experiment(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    experiment_id = arguments["experiment_id"]
+
+    result = client.delete_experiment(experiment_id)
+
+    return [
+        TextContent(
+            type="text",
+            text=_dumps(result),
+        )
+    ]
+
+
+def _handle_list_experiments(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    limit = arguments.get("limit", 15)
+    offset = arguments.get("offset", 0)
+    search = arguments.get("search")
+    owner = arguments.get("owner")
+
+    result = client.list_experiments(
+        limit=limit,
+        offset=offset,
+        search=search,
+        owner=owner,
+    )
+
+    return _listing(
+        result,
+        _experiment_summaries,
+        "experiments",
+        pretty=arguments.get("pretty", False),
+    )
+
+
+def _handle_get_experiment(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    experiment_id = arguments["experiment_id"]
+    result = client.get_experiment(experiment_id)
+
+    return [
+        TextContent(
+            type="text",
+            text=f"Experiment {experiment_id}:\n\n{_dumps(result)}",
+        )
+    ]
+
+
+def _handle_create_experiment(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    title = arguments["title"]
+    body = arguments.get("body", "")
+    template = arguments.get("template")
+    category = arguments.get("category")
+    tags = arguments.get("tags")
+
+    result = client.create_experiment(
+        title=title,
+        body=body,
+        template=template,
+        category=category,
+        tags=tags,
+    )
+
+    return [
+        TextContent(
+            type="text",
+            text=f"Successfully created experiment:\n\n{_dumps(result)}",
+        )
+    ]
+
+
+def _handle_create_experiment_guided(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.create_experiment_guided(
+        title=arguments["title"],
+        template_hint=arguments.get("template_hint"),
+        category_hint=arguments.get("category_hint"),
+        body=arguments.get("body", ""),
+        tags=arguments.get("tags"),
+        team_id=arguments.get("team_id", 1),
+    )
+
+    return [
+        TextContent(
+            type="text",
+            text=f"Successfully created experiment:\n\n{_dumps(result)}",
+        )
+    ]
+
+
+def _handle_update_experiment(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    experiment_id = arguments["experiment_id"]
+    title = arguments.get("title")
+    body = arguments.get("body")
+    category = arguments.get("category")
+    status = arguments.get("status")
+
+    result = client.update_experiment(
+        experiment_id=experiment_id,
+        title=title,
+        body=body,
+        category=category,
+        status=status,
+    )
+
+    return [
+        TextContent(
+            type="text",
+            text=f"Successfully updated experiment {experiment_id}:\n\n{_dumps(result)}",
+        )
+    ]
+
+
+def _handle_add_tag(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    experiment_id = arguments["experiment_id"]
+    tag = arguments["tag"]
+
+    result = client.add_tag_to_experiment(experiment_id, tag)
+
+    return [
+        TextContent(
+            type="text",
+            text=_dumps(result),
+        )
+    ]
+
+
+def _handle_remove_tag(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    experiment_id = arguments["experiment_id"]
+    tag_id = arguments["tag_id"]
+
+    result = client.remove_tag_from_experiment(experiment_id, tag_id)
+
+    return [
+        TextContent(
+            type="text",
+            text=_dumps(result),
+        )
+    ]
+
+
+def _handle_set_experiment_status(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    experiment_id = arguments["experiment_id"]
+    status_id = arguments["status_id"]
+
+    result = client.set_experiment_status(experiment_id, status_id)
+
+    return [
+        TextContent(
+            type="text",
+            text=f"Successfully updated status for experiment {experiment_id}:\n\n{_dumps(result)}",
+        )
     ]
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls for elabFTW operations."""
+def _handle_link_item(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    experiment_id = arguments["experiment_id"]
+    link_id = arguments["link_id"]
+    link_type = arguments.get("link_type", "experiments")
 
-    # Return the lab prompt content when requested (no API key needed)
-    if name == "lab_prompt_elabftw":
-        return [
-            TextContent(
-                type="text",
-                text=LAB_PROMPT.strip(),
-            )
-        ]
+    result = client.link_item_to_experiment(
+        experiment_id, link_id, link_type
+    )
 
-    if not API_KEY:
-        return [
-            TextContent(
-                type="text",
-                text="Error: ELABFTW_API_KEY environment variable is not set. Please configure your API key.",
-            )
-        ]
+    return [
+        TextContent(
+            type="text",
+            text=_dumps(result),
+        )
+    ]
 
-    try:
-        if name == "list_experiment_templates":
-            limit = arguments.get("limit", 15)
-            offset = arguments.get("offset", 0)
 
-            result = elabftw_client.list_experiment_templates(
-                limit=min(limit, 100),
-                offset=offset,
-            )
+def _handle_upload_attachment(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    experiment_id = arguments["experiment_id"]
+    file_path = arguments["file_path"]
+    comment = arguments.get("comment")
 
-            if isinstance(result, list):
-                templates_info = []
-                for tpl in result:
-                    tpl_info = {
-                        "id": tpl.get("id"),
-                        "title": tpl.get("title"),
-                        "created_at": tpl.get("created_at"),
-                        "modified_at": tpl.get("modified_at"),
-                    }
-                    templates_info.append(tpl_info)
-
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Found {len(templates_info)} experiment TEMPLATES:\n\n{json.dumps(templates_info, indent=2)}\n\nUse the 'id' as the 'template' parameter when creating a new experiment.\n\nNOTE: Templates define experiment structure. For classification categories, use list_experiment_categories instead.",
-                    )
-                ]
-            else:
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-
-        elif name == "list_experiment_categories":
-            team_id = arguments.get("team_id", 1)
-
-            result = elabftw_client.list_experiment_categories(team_id=team_id)
-
-            if isinstance(result, list):
-                categories_info = []
-                for cat in result:
-                    cat_info = {
-                        "id": cat.get("id"),
-                        "title": cat.get("title"),
-                        "color": cat.get("color"),
-                        "is_default": cat.get("is_default"),
-                    }
-                    categories_info.append(cat_info)
-
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Found {len(categories_info)} experiment CATEGORIES:\n\n{json.dumps(categories_info, indent=2)}\n\nUse the 'id' as the 'category' parameter when creating or updating experiments.\n\nNOTE: Categories classify experiments. For experiment structure/templates, use list_experiment_templates instead.",
-                    )
-                ]
-            else:
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
+    result = client.upload_attachment(experiment_id, file_path, comment)
 
-        elif name == "delete_experiment":
-            experiment_id = arguments["experiment_id"]
+    return [
+        TextContent(
+            type="text",
+            text=_dumps(result),
+        )
+    ]
 
-            result = elabftw_client.delete_experiment(experiment_id)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
+# ==================== ITEMS/RESOURCES HANDLERS ====================
 
-        elif name == "list_experiments":
-            limit = arguments.get("limit", 15)
-            offset = arguments.get("offset", 0)
-            search = arguments.get("search")
-            owner = arguments.get("owner")
-
-            result = elabftw_client.list_experiments(
-                limit=min(limit, 100),  # Cap at 100
-                offset=offset,
-                search=search,
-                owner=owner,
-            )
 
-            # Format the output nicely
-            if isinstance(result, list):
-                experiments_info = []
-                for exp in result:
-                    exp_info = {
-                        "id": exp.get("id"),
-                        "title": exp.get("title"),
-                        "created_at": exp.get("created_at"),
-                        "modified_at": exp.get("modified_at"),
-                        "category": exp.get("category"),
-                        "status": exp.get("status"),
-                        "owner": exp.get("userid"),
-                        "owner_name": exp.get("fullname"),
-                    }
-                    experiments_info.append(exp_info)
-
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Found {len(experiments_info)} experiments:\n\n{json.dumps(experiments_info, indent=2)}",
-                    )
-                ]
-            else:
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
+def _handle_list_items(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    limit = arguments.get("limit", 15)
+    offset = arguments.get("offset", 0)
+    search = arguments.get("search")
+    category = arguments.get("category")
+    owner = arguments.get("owner")
 
-        elif name == "get_experiment":
-            experiment_id = arguments["experiment_id"]
-            result = elabftw_client.get_experiment(experiment_id)
+    result = client.list_items(
+        limit=limit,
+        offset=offset,
+        search=search,
+        category=category,
+        owner=owner,
+    )
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Experiment {experiment_id}:\n\n{json.dumps(result, indent=2)}",
-                )
-            ]
+    return _listing(
+        result,
+        _item_summaries,
+        "items (resources)",
+        pretty=arguments.get("pretty", False),
+    )
 
-        elif name == "create_experiment":
-            title = arguments["title"]
-            body = arguments.get("body", "")
-            template = arguments.get("template")
-            category = arguments.get("category")
-            tags = arguments.get("tags")
-
-            result = elabftw_client.create_experiment(
-                title=title,
-                body=body,
-                template=template,
-                category=category,
-                tags=tags,
-            )
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Successfully created experiment:\n\n{json.dumps(result, indent=2)}",
-                )
-            ]
+def _handle_get_item(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    item_id = arguments["item_id"]
+    result = client.get_item(item_id)
 
-        elif name == "update_experiment":
-            experiment_id = arguments["experiment_id"]
-            title = arguments.get("title")
-            body = arguments.get("body")
-            category = arguments.get("category")
-            status = arguments.get("status")
-
-            result = elabftw_client.update_experiment(
-                experiment_id=experiment_id,
-                title=title,
-                body=body,
-                category=category,
-                status=status,
-            )
+    return [
+        TextContent(
+            type="text",
+            text=f"Item {item_id}:\n\n{_dumps(result)}",
+        )
+    ]
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Successfully updated experiment {experiment_id}:\n\n{json.dumps(result, indent=2)}",
-                )
-            ]
 
-        elif name == "add_tag":
-            experiment_id = arguments["experiment_id"]
-            tag = arguments["tag"]
+def _handle_create_item(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    category = arguments["category"]
+    title = arguments.get("title")
+    body = arguments.get("body", "")
+    tags = arguments.get("tags")
 
-            result = elabftw_client.add_tag_to_experiment(experiment_id, tag)
+    result = client.create_item(
+        category=category,
+        title=title,
+        body=body,
+        tags=tags,
+    )
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
+    return [
+        TextContent(
+            type="text",
+            text=f"Successfully created item:\n\n{_dumps(result)}",
+        )
+    ]
 
-        elif name == "remove_tag":
-            experiment_id = arguments["experiment_id"]
-            tag_id = arguments["tag_id"]
 
-            result = elabftw_client.remove_tag_from_experiment(experiment_id, tag_id)
+def _handle_update_item(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    item_id = arguments["item_id"]
+    title = arguments.get("title")
+    body = arguments.get("body")
+    category = arguments.get("category")
+    rating = arguments.get("rating")
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
+    result = client.update_item(
+        item_id=item_id,
+        title=title,
+        body=body,
+        category=category,
+        rating=rating,
+    )
 
-        elif name == "set_experiment_status":
-            experiment_id = arguments["experiment_id"]
-            status_id = arguments["status_id"]
+    return [
+        TextContent(
+            type="text",
+            text=f"Successfully updated item {item_id}:\n\n{_dumps(result)}",
+        )
+    ]
 
-            result = elabftw_client.set_experiment_status(experiment_id, status_id)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Successfully updated status for experiment {experiment_id}:\n\n{json.dumps(result, indent=2)}",
-                )
-            ]
+def _handle_delete_item(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    item_id = arguments["item_id"]
 
-        elif name == "link_item":
-            experiment_id = arguments["experiment_id"]
-            link_id = arguments["link_id"]
-            link_type = arguments.get("link_type", "experiments")
+    result = client.delete_item(item_id)
 
-            result = elabftw_client.link_item_to_experiment(
-                experiment_id, link_id, link_type
-            )
+    return [
+        TextContent(
+            type="text",
+            text=_dumps(result),
+        )
+    ]
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
 
-        elif name == "upload_attachment":
-            experiment_id = arguments["experiment_id"]
-            file_path = arguments["file_path"]
-            comment = arguments.get("comment")
+def _handle_list_items_types(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    team_id = arguments.get("team_id", 1)
 
-            result = elabftw_client.upload_attachment(experiment_id, file_path, comment)
+    result = client.list_items_types(
+        team_id=team_id, refresh=arguments.get("refresh", False)
+    )
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
+    return _listing(
+        result,
+        _item_type_summaries,
+        "item types/categories",
+        "\n\nUse the 'id' as the 'category' parameter when creating items or "
+        "filtering the item list.",
+        pretty=arguments.get("pretty", False),
+    )
 
-        # ==================== ITEMS/RESOURCES HANDLERS ====================
-
-        elif name == "list_items":
-            limit = arguments.get("limit", 15)
-            offset = arguments.get("offset", 0)
-            search = arguments.get("search")
-            category = arguments.get("category")
-            owner = arguments.get("owner")
-
-            result = elabftw_client.list_items(
-                limit=min(limit, 100),
-                offset=offset,
-                search=search,
-                category=category,
-                owner=owner,
-            )
 
-            if isinstance(result, list):
-                items_info = []
-                for item in result:
-                    item_info = {
-                        "id": item.get("id"),
-                        "title": item.get("title"),
-                        "category": item.get("category"),
-                        "category_title": item.get("category_title"),
-                        "created_at": item.get("created_at"),
-                        "modified_at": item.get("modified_at"),
-                        "rating": item.get("rating"),
-                        "owner": item.get("userid"),
-                        "owner_name": item.get("fullname"),
-                    }
-                    items_info.append(item_info)
-
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Found {len(items_info)} items (resources):\n\n{json.dumps(items_info, indent=2)}",
-                    )
-                ]
-            else:
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
+def _handle_add_item_tag(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    item_id = arguments["item_id"]
+    tag = arguments["tag"]
 
-        elif name == "get_item":
-            item_id = arguments["item_id"]
-            result = elabftw_client.get_item(item_id)
+    result = client.add_tag_to_item(item_id, tag)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Item {item_id}:\n\n{json.dumps(result, indent=2)}",
-                )
-            ]
+    return [
+        TextContent(
+            type="text",
+            text=_dumps(result),
+        )
+    ]
 
-        elif name == "create_item":
-            category = arguments["category"]
-            title = arguments.get("title")
-            body = arguments.get("body", "")
-            tags = arguments.get("tags")
-
-            result = elabftw_client.create_item(
-                category=category,
-                title=title,
-                body=body,
-                tags=tags,
-            )
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Successfully created item:\n\n{json.dumps(result, indent=2)}",
-                )
-            ]
+def _handle_remove_item_tag(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    item_id = arguments["item_id"]
+    tag_id = arguments["tag_id"]
 
-        elif name == "update_item":
-            item_id = arguments["item_id"]
-            title = arguments.get("title")
-            body = arguments.get("body")
-            category = arguments.get("category")
-            rating = arguments.get("rating")
-
-            result = elabftw_client.update_item(
-                item_id=item_id,
-                title=title,
-                body=body,
-                category=category,
-                rating=rating,
-            )
+    result = client.remove_tag_from_item(item_id, tag_id)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Successfully updated item {item_id}:\n\n{json.dumps(result, indent=2)}",
-                )
-            ]
+    return [
+        TextContent(
+            type="text",
+            text=_dumps(result),
+        )
+    ]
 
-        elif name == "delete_item":
-            item_id = arguments["item_id"]
 
-            result = elabftw_client.delete_item(item_id)
+def _handle_upload_item_attachment(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    item_id = arguments["item_id"]
+    file_path = arguments["file_path"]
+    comment = arguments.get("comment")
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
+    result = client.upload_attachment_to_item(
+        item_id, file_path, comment
+    )
 
-        elif name == "list_items_types":
-            team_id = arguments.get("team_id", 1)
-
-            result = elabftw_client.list_items_types(team_id=team_id)
-
-            if isinstance(result, list):
-                types_info = []
-                for item_type in result:
-                    type_info = {
-                        "id": item_type.get("id"),
-                        "title": item_type.get("title"),
-                        "color": item_type.get("color"),
-                        "body": item_type.get("body", "")[:100] + "..."
-                        if len(item_type.get("body", "")) > 100
-                        else item_type.get("body", ""),
-                    }
-                    types_info.append(type_info)
-
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Found {len(types_info)} item types/categories:\n\n{json.dumps(types_info, indent=2)}\n\nUse the 'id' as the 'category' parameter when creating items or filtering the item list.",
-                    )
-                ]
-            else:
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
+    return [
+        TextContent(
+            type="text",
+            text=_dumps(result),
+        )
+    ]
 
-        elif name == "add_item_tag":
-            item_id = arguments["item_id"]
-            tag = arguments["tag"]
 
-            result = elabftw_client.add_tag_to_item(item_id, tag)
+def _handle_link_to_item(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    item_id = arguments["item_id"]
+    link_id = arguments["link_id"]
+    link_type = arguments.get("link_type", "items")
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
+    result = client.link_item_to_item(item_id, link_id, link_type)
 
-        elif name == "remove_item_tag":
-            item_id = arguments["item_id"]
-            tag_id = arguments["tag_id"]
+    return [
+        TextContent(
+            type="text",
+            text=_dumps(result),
+        )
+    ]
 
-            result = elabftw_client.remove_tag_from_item(item_id, tag_id)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
+# ==================== BOOKING/EVENTS HANDLERS ====================
 
-        elif name == "upload_item_attachment":
-            item_id = arguments["item_id"]
-            file_path = arguments["file_path"]
-            comment = arguments.get("comment")
 
-            result = elabftw_client.upload_attachment_to_item(
-                item_id, file_path, comment
-            )
+def _handle_list_bookings(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    limit = arguments.get("limit", 50)
+    offset = arguments.get("offset", 0)
+    start = arguments.get("start")
+    end = arguments.get("end")
+    item_id = arguments.get("item_id")
+    after = arguments.get("after")
+    pretty = arguments.get("pretty", False)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
+    result = client.list_events(
+        limit=limit,
+        offset=offset,
+        start=start,
+        end=end,
+        item_id=item_id,
+        fields=list(_BOOKING_FIELDS),
+        after=after,
+    )
 
-        elif name == "link_to_item":
-            item_id = arguments["item_id"]
-            link_id = arguments["link_id"]
-            link_type = arguments.get("link_type", "items")
+    footer = ""
+    if isinstance(result, list) and result and len(result) >= limit:
+        footer = f'\n\nMore bookings may follow. Pass after="{_event_cursor(result[-1])}" to get the next page.'
+    return _listing(result, _booking_summaries, "bookings", footer, pretty=pretty)
 
-            result = elabftw_client.link_item_to_item(item_id, link_id, link_type)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
+def _handle_get_booking(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    event_id = arguments["event_id"]
+    result = client.get_event(event_id)
 
-        # ==================== BOOKING/EVENTS HANDLERS ====================
-
-        elif name == "list_bookings":
-            limit = arguments.get("limit", 50)
-            offset = arguments.get("offset", 0)
-            start = arguments.get("start")
-            end = arguments.get("end")
-            item_id = arguments.get("item_id")
-
-            result = elabftw_client.list_events(
-                limit=limit,
-                offset=offset,
-                start=start,
-                end=end,
-                item_id=item_id,
-            )
+    return [
+        TextContent(
+            type="text",
+            text=f"Booking {event_id}:\n\n{_dumps(result)}",
+        )
+    ]
 
-            if isinstance(result, list):
-                bookings_info = []
-                for event in result:
-                    booking_info = {
-                        "id": event.get("id"),
-                        "title": event.get("title"),
-                        "item_id": event.get("items_id"),
-                        "item_title": event.get("item_title"),
-                        "start": event.get("start"),
-                        "end": event.get("end"),
-                        "user": event.get("fullname"),
-                        "user_id": event.get("userid"),
-                        "duration_minutes": event.get("event_duration_minutes"),
-                        "is_cancellable": event.get("book_is_cancellable"),
-                    }
-                    bookings_info.append(booking_info)
-
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Found {len(bookings_info)} bookings:\n\n{json.dumps(bookings_info, indent=2)}",
-                    )
-                ]
-            else:
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
 
-        elif name == "get_booking":
-            event_id = arguments["event_id"]
-            result = elabftw_client.get_event(event_id)
+def _handle_create_booking(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.create_booking(
+        item_id=arguments["item_id"],
+        start=arguments["start"],
+        end=arguments["end"],
+        title=arguments.get("title"),
+    )
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Booking {event_id}:\n\n{json.dumps(result, indent=2)}",
-                )
-            ]
+    return [
+        TextContent(
+            type="text",
+            text=f"Successfully created booking:\n\n{_dumps(result)}",
+        )
+    ]
 
-        elif name == "create_booking":
-            item_id = arguments["item_id"]
-            start = arguments["start"]
-            end = arguments["end"]
-            title = arguments.get("title")
-
-            result = elabftw_client.create_booking(
-                item_id=item_id,
-                start=start,
-                end=end,
-                title=title,
-            )
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Successfully created booking:\n\n{json.dumps(result, indent=2)}",
-                )
-            ]
+def _handle_create_bookings_bulk(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.create_bookings(arguments["bookings"])
+    failed = sum(1 for r in result if r.get("status") == "error")
 
-        elif name == "update_booking":
-            event_id = arguments["event_id"]
-            start = arguments.get("start")
-            end = arguments.get("end")
-            title = arguments.get("title")
-
-            result = elabftw_client.update_booking(
-                event_id=event_id,
-                start=start,
-                end=end,
-                title=title,
-            )
+    return [
+        TextContent(
+            type="text",
+            text=f"Created {len(result) - failed} of {len(result)} bookings:\n\n{_dumps(result)}",
+        )
+    ]
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Successfully updated booking:\n\n{json.dumps(result, indent=2)}",
-                )
-            ]
 
-        elif name == "cancel_booking":
-            event_id = arguments["event_id"]
+def _handle_update_booking(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.update_booking(
+        event_id=arguments["event_id"],
+        start=arguments.get("start"),
+        end=arguments.get("end"),
+        title=arguments.get("title"),
+    )
 
-            result = elabftw_client.delete_booking(event_id)
+    return [
+        TextContent(
+            type="text",
+            text=f"Successfully updated booking:\n\n{_dumps(result)}",
+        )
+    ]
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
 
-        elif name == "get_bookable_items":
-            limit = arguments.get("limit", 50)
-
-            # Get all items and filter for bookable ones
-            all_items = elabftw_client.list_items(limit=limit)
-
-            bookable_items = []
-            for item in all_items:
-                if item.get("is_bookable") == 1:
-                    # Get full details to show booking settings
-                    full_item = elabftw_client.get_item(item["id"])
-                    bookable_info = {
-                        "id": full_item.get("id"),
-                        "title": full_item.get("title"),
-                        "category": full_item.get("category_title"),
-                        "max_duration_minutes": full_item.get("book_max_minutes")
-                        or "unlimited",
-                        "max_concurrent_slots": full_item.get("book_max_slots")
-                        or "unlimited",
-                        "can_overlap": bool(full_item.get("book_can_overlap")),
-                        "is_cancellable": bool(full_item.get("book_is_cancellable")),
-                        "cancel_advance_minutes": full_item.get("book_cancel_minutes"),
-                        "can_book_in_past": bool(
-                            full_item.get("book_users_can_in_past")
-                        ),
-                    }
-                    bookable_items.append(bookable_info)
+def _handle_cancel_booking(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.delete_booking(arguments["event_id"])
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Found {len(bookable_items)} bookable items:\n\n{json.dumps(bookable_items, indent=2)}",
-                )
-            ]
+    return [
+        TextContent(
+            type="text",
+            text=_dumps(result),
+        )
+    ]
 
-        # ==================== UPLOAD LISTING HANDLERS ====================
-
-        elif name == "list_experiment_uploads":
-            experiment_id = arguments["experiment_id"]
-            result = elabftw_client.list_experiment_uploads(experiment_id)
-            if not result:
-                return [TextContent(type="text", text=f"No files attached to experiment {experiment_id}.")]
-            summary = []
-            for u in result:
-                summary.append({
-                    "id": u.get("id"),
-                    "filename": u.get("real_name"),
-                    "size_bytes": u.get("filesize"),
-                    "uploaded_by": u.get("fullname"),
-                    "uploaded_at": u.get("created_at"),
-                    "comment": u.get("comment"),
-                    "hash_sha256": u.get("hash"),
-                    "download_url": u.get("download_url"),
-                })
-            return [TextContent(type="text", text=f"Experiment {experiment_id} has {len(summary)} attachment(s):\n\n{json.dumps(summary, indent=2)}")]
-
-        elif name == "list_item_uploads":
-            item_id = arguments["item_id"]
-            result = elabftw_client.list_item_uploads(item_id)
-            if not result:
-                return [TextContent(type="text", text=f"No files attached to item {item_id}.")]
-            summary = []
-            for u in result:
-                summary.append({
-                    "id": u.get("id"),
-                    "filename": u.get("real_name"),
-                    "size_bytes": u.get("filesize"),
-                    "uploaded_by": u.get("fullname"),
-                    "uploaded_at": u.get("created_at"),
-                    "comment": u.get("comment"),
-                    "hash_sha256": u.get("hash"),
-                    "download_url": u.get("download_url"),
-                })
-            return [TextContent(type="text", text=f"Item {item_id} has {len(summary)} attachment(s):\n\n{json.dumps(summary, indent=2)}")]
-
-        # ==================== STEPS HANDLERS ====================
-
-        elif name == "add_experiment_step":
-            result = elabftw_client.add_experiment_step(
-                arguments["experiment_id"], arguments["body"]
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
-        elif name == "update_experiment_step":
-            result = elabftw_client.update_experiment_step(
-                arguments["experiment_id"], arguments["step_id"], arguments["body"]
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+def _handle_get_bookable_items(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    limit = arguments.get("limit", 50)
+    pretty = arguments.get("pretty", False)
 
-        elif name == "delete_experiment_step":
-            result = elabftw_client.delete_experiment_step(
-                arguments["experiment_id"], arguments["step_id"]
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    bookable = client.list_bookable_items(limit=limit)
 
-        elif name == "add_item_step":
-            result = elabftw_client.add_item_step(
-                arguments["item_id"], arguments["body"]
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    # List rows normally carry the booking settings already; fetch
+    # full details (concurrently) only for rows that lack them
+    missing = [i for i, item in enumerate(bookable) if "book_max_minutes" not in item]
+    details = client.get_bookable_item_details([bookable[i]["id"] for i in missing])
+    for i, full_item in zip(missing, details):
+        bookable[i] = full_item
 
-        elif name == "update_item_step":
-            result = elabftw_client.update_item_step(
-                arguments["item_id"], arguments["step_id"], arguments["body"]
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    bookable_items = [_bookable_info(item) for item in bookable]
 
-        elif name == "delete_item_step":
-            result = elabftw_client.delete_item_step(
-                arguments["item_id"], arguments["step_id"]
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    return [
+        TextContent(
+            type="text",
+            text=f"Found {len(bookable_items)} bookable items:\n\n{_dumps(bookable_items, pretty)}",
+        )
+    ]
 
-        # ==================== COMMENTS HANDLERS ====================
 
-        elif name == "list_experiment_comments":
-            experiment_id = arguments["experiment_id"]
-            result = elabftw_client.list_experiment_comments(experiment_id)
-            if not result:
-                return [TextContent(type="text", text=f"No comments on experiment {experiment_id}.")]
-            return [TextContent(type="text", text=f"{len(result)} comment(s) on experiment {experiment_id}:\n\n{json.dumps(result, indent=2)}")]
+# ==================== UPLOAD LISTING HANDLERS ====================
 
-        elif name == "add_experiment_comment":
-            result = elabftw_client.add_experiment_comment(
-                arguments["experiment_id"], arguments["comment"]
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
-        elif name == "delete_experiment_comment":
-            result = elabftw_client.delete_experiment_comment(
-                arguments["experiment_id"], arguments["comment_id"]
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "list_item_comments":
-            item_id = arguments["item_id"]
-            result = elabftw_client.list_item_comments(item_id)
-            if not result:
-                return [TextContent(type="text", text=f"No comments on item {item_id}.")]
-            return [TextContent(type="text", text=f"{len(result)} comment(s) on item {item_id}:\n\n{json.dumps(result, indent=2)}")]
-
-        elif name == "add_item_comment":
-            result = elabftw_client.add_item_comment(
-                arguments["item_id"], arguments["comment"]
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+def _handle_list_experiment_uploads(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    experiment_id = arguments["experiment_id"]
+    pretty = arguments.get("pretty", False)
+    result = client.list_experiment_uploads(experiment_id)
+    if not result:
+        return [TextContent(type="text", text=f"No files attached to experiment {experiment_id}.")]
+    summary = _upload_summaries(result)
+    return [TextContent(type="text", text=f"Experiment {experiment_id} has {len(summary)} attachment(s):\n\n{_dumps(summary, pretty)}")]
+
+
+def _handle_list_item_uploads(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    item_id = arguments["item_id"]
+    pretty = arguments.get("pretty", False)
+    result = client.list_item_uploads(item_id)
+    if not result:
+        return [TextContent(type="text", text=f"No files attached to item {item_id}.")]
+    summary = _upload_summaries(result)
+    return [TextContent(type="text", text=f"Item {item_id} has {len(summary)} attachment(s):\n\n{_dumps(summary, pretty)}")]
 
-        elif name == "delete_item_comment":
-            result = elabftw_client.delete_item_comment(
-                arguments["item_id"], arguments["comment_id"]
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
-        # ==================== PUBCHEM HANDLERS ====================
+# ==================== STEPS HANDLERS ====================
 
-        elif name == "lookup_pubchem":
-            result = elabftw_client.lookup_pubchem(arguments["identifier"])
-            if "error" in result:
-                return [TextContent(type="text", text=result["error"])]
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
-        elif name == "create_chemical_from_pubchem":
-            result = elabftw_client.create_chemical_from_pubchem(
-                identifier=arguments["identifier"],
-                category_id=arguments["category_id"],
-                additional_notes=arguments.get("additional_notes"),
-            )
-            if "error" in result:
-                return [TextContent(type="text", text=result["error"])]
-            return [TextContent(type="text", text=f"Chemical item created from PubChem:\n\n{json.dumps(result, indent=2)}")]
+def _handle_add_experiment_step(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.add_experiment_step(
+        arguments["experiment_id"], arguments["body"]
+    )
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+def _handle_update_experiment_step(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.update_experiment_step(
+        arguments["experiment_id"], arguments["step_id"], arguments["body"]
+    )
+    return [TextContent(type="text", text=_dumps(result))]
+
 
-        else:
+def _handle_delete_experiment_step(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.delete_experiment_step(
+        arguments["experiment_id"], arguments["step_id"]
+    )
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+def _handle_add_item_step(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.add_item_step(
+        arguments["item_id"], arguments["body"]
+    )
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+def _handle_update_item_step(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.update_item_step(
+        arguments["item_id"], arguments["step_id"], arguments["body"]
+    )
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+def _handle_delete_item_step(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.delete_item_step(
+        arguments["item_id"], arguments["step_id"]
+    )
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+# ==================== COMMENTS HANDLERS ====================
+
+
+def _handle_list_experiment_comments(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    experiment_id = arguments["experiment_id"]
+    pretty = arguments.get("pretty", False)
+    result = client.list_experiment_comments(experiment_id)
+    if not result:
+        return [TextContent(type="text", text=f"No comments on experiment {experiment_id}.")]
+    return [TextContent(type="text", text=f"{len(result)} comment(s) on experiment {experiment_id}:\n\n{_dumps(result, pretty)}")]
+
+
+def _handle_add_experiment_comment(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.add_experiment_comment(
+        arguments["experiment_id"], arguments["comment"]
+    )
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+def _handle_delete_experiment_comment(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.delete_experiment_comment(
+        arguments["experiment_id"], arguments["comment_id"]
+    )
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+def _handle_list_item_comments(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    item_id = arguments["item_id"]
+    pretty = arguments.get("pretty", False)
+    result = client.list_item_comments(item_id)
+    if not result:
+        return [TextContent(type="text", text=f"No comments on item {item_id}.")]
+    return [TextContent(type="text", text=f"{len(result)} comment(s) on item {item_id}:\n\n{_dumps(result, pretty)}")]
+
+
+def _handle_add_item_comment(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.add_item_comment(
+        arguments["item_id"], arguments["comment"]
+    )
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+def _handle_delete_item_comment(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.delete_item_comment(
+        arguments["item_id"], arguments["comment_id"]
+    )
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+# ==================== PUBCHEM HANDLERS ====================
+
+
+def _handle_lookup_pubchem(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.lookup_pubchem(arguments["identifier"])
+    if "error" in result:
+        return [TextContent(type="text", text=result["error"])]
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+def _handle_create_chemical_from_pubchem(
+    client: ElabFTWClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    result = client.create_chemical_from_pubchem(
+        identifier=arguments["identifier"],
+        category_id=arguments["category_id"],
+        additional_notes=arguments.get("additional_notes"),
+    )
+    if "error" in result:
+        return [TextContent(type="text", text=result["error"])]
+    return [TextContent(type="text", text=f"Chemical item created from PubChem:\n\n{_dumps(result)}")]
+
+
+# Tool name -> handler; call_tool looks the handler up instead of walking an
+# if/elif chain
+TOOL_DISPATCH: dict[
+    str, Callable[[ElabFTWClient, dict[str, Any]], list[TextContent]]
+] = {
+    "list_experiment_templates": _handle_list_experiment_templates,
+    "list_experiment_categories": _handle_list_experiment_categories,
+    "delete_experiment": _handle_delete_experiment,
+    "list_experiments": _handle_list_experiments,
+    "get_experiment": _handle_get_experiment,
+    "create_experiment": _handle_create_experiment,
+    "create_experiment_guided": _handle_create_experiment_guided,
+    "update_experiment": _handle_update_experiment,
+    "add_tag": _handle_add_tag,
+    "remove_tag": _handle_remove_tag,
+    "set_experiment_status": _handle_set_experiment_status,
+    "link_item": _handle_link_item,
+    "upload_attachment": _handle_upload_attachment,
+    "list_items": _handle_list_items,
+    "get_item": _handle_get_item,
+    "create_item": _handle_create_item,
+    "update_item": _handle_update_item,
+    "delete_item": _handle_delete_item,
+    "list_items_types": _handle_list_items_types,
+    "add_item_tag": _handle_add_item_tag,
+    "remove_item_tag": _handle_remove_item_tag,
+    "upload_item_attachment": _handle_upload_item_attachment,
+    "link_to_item": _handle_link_to_item,
+    "list_bookings": _handle_list_bookings,
+    "get_booking": _handle_get_booking,
+    "create_booking": _handle_create_booking,
+    "create_bookings_bulk": _handle_create_bookings_bulk,
+    "update_booking": _handle_update_booking,
+    "cancel_booking": _handle_cancel_booking,
+    "get_bookable_items": _handle_get_bookable_items,
+    "list_experiment_uploads": _handle_list_experiment_uploads,
+    "list_item_uploads": _handle_list_item_uploads,
+    "add_experiment_step": _handle_add_experiment_step,
+    "update_experiment_step": _handle_update_experiment_step,
+    "delete_experiment_step": _handle_delete_experiment_step,
+    "add_item_step": _handle_add_item_step,
+    "update_item_step": _handle_update_item_step,
+    "delete_item_step": _handle_delete_item_step,
+    "list_experiment_comments": _handle_list_experiment_comments,
+    "add_experiment_comment": _handle_add_experiment_comment,
+    "delete_experiment_comment": _handle_delete_experiment_comment,
+    "list_item_comments": _handle_list_item_comments,
+    "add_item_comment": _handle_add_item_comment,
+    "delete_item_comment": _handle_delete_item_comment,
+    "lookup_pubchem": _handle_lookup_pubchem,
+    "create_chemical_from_pubchem": _handle_create_chemical_from_pubchem,
+}
+
+
+# The lab prompt tool result never changes, so it is built once
+_LAB_PROMPT_RESULT: Final[list[TextContent]] = [
+    TextContent(
+        type="text",
+        text=LAB_PROMPT,
+    )
+]
+
+
+# Returned by every API tool while no API key is configured (main() also
+# warns about it at startup)
+_NO_API_KEY_RESULT: Final[list[TextContent]] = [
+    TextContent(
+        type="text",
+        text="Error: ELABFTW_API_KEY environment variable is not set. Please configure your API key.",
+    )
+]
+
+
+# Appended to connection errors so the user knows where to look
+_CONNECTION_HINT: Final[str] = (
+    "\n\nPlease check that:\n1. The ELABFTW_API_URL is correct\n"
+    "2. The server is reachable\n3. SSL certificates are properly configured "
+    "(or set ELABFTW_VERIFY_SSL=false for self-signed certs)"
+)
+
+
+# Arguments are validated against the prebuilt validators in call_tool instead
+@server.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle tool calls for elabFTW operations."""
+    validator = _INPUT_VALIDATORS.get(name)
+    if validator is not None:
+        try:
+            validator.validate(arguments)
+        except jsonschema.ValidationError as e:
+            # Raised errors are returned to the client as an error result
+            raise ValueError(f"Input validation error: {e.message}") from e
+    # ElabFTWClient is synchronous; run the call in a worker thread so the event
+    # loop keeps serving other requests while this one waits on the network
+    return await anyio.to_thread.run_sync(_call_tool, name, arguments)
+
+
+def _to_text_content(
+    fn: Callable[[str, dict[str, Any]], list[TextContent]],
+) -> Callable[[str, dict[str, Any]], list[TextContent]]:
+    """Report errors raised by a tool call as text instead of propagating them."""
+
+    @wraps(fn)
+    def wrapper(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        try:
+            return fn(name, arguments)
+        except httpx.HTTPStatusError as e:
+            error_msg = f"HTTP Error {e.response.status_code}: {e.response.text}"
+            logger.error(error_msg)
             return [
                 TextContent(
                     type="text",
-                    text=f"Unknown tool: {name}",
+                    text=f"Error communicating with elabFTW: {error_msg}",
+                )
+            ]
+        except httpx.RequestError as e:
+            error_msg = f"Request Error: {str(e)}"
+            logger.error(error_msg)
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error connecting to elabFTW server: {error_msg}{_CONNECTION_HINT}",
+                )
+            ]
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
+            logger.error(error_msg, exc_info=DEBUG_TRACEBACKS)
+            return [
+                TextContent(
+                    type="text",
+                    text=f"An unexpected error occurred: {error_msg}",
                 )
             ]
 
-    except httpx.HTTPStatusError as e:
-        error_msg = f"HTTP Error {e.response.status_code}: {e.response.text}"
-        logger.error(error_msg)
-        return [
-            TextContent(
-                type="text",
-                text=f"Error communicating with elabFTW: {error_msg}",
-            )
-        ]
-    except httpx.RequestError as e:
-        error_msg = f"Request Error: {str(e)}"
-        logger.error(error_msg)
-        return [
-            TextContent(
-                type="text",
-                text=f"Error connecting to elabFTW server: {error_msg}\n\nPlease check that:\n1. The ELABFTW_API_URL is correct\n2. The server is reachable\n3. SSL certificates are properly configured (or set ELABFTW_VERIFY_SSL=false for self-signed certs)",
-            )
-        ]
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(error_msg, exc_info=True)
+    return wrapper
+
+
+@_to_text_content
+def _call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle a tool call (blocking; runs in a worker thread)."""
+
+    # Return the lab prompt content when requested (no API key needed)
+    if name == "lab_prompt_elabftw":
+        return _LAB_PROMPT_RESULT
+
+    if not API_KEY:
+        return _NO_API_KEY_RESULT
+
+    handler = TOOL_DISPATCH.get(name)
+    if handler is None:
         return [
             TextContent(
                 type="text",
-                text=f"An unexpected error occurred: {error_msg}",
+                text=f"Unknown tool: {name}",
             )
         ]
+    return handler(elabftw_client, arguments)
 
 
 async def main():
@@ -3251,15 +4619,19 @@ async def main():
             "ELABFTW_API_KEY is not set! Please set it before using the server."
         )
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        # Release the pooled keep-alive connections on shutdown
+        elabftw_client.close()
 
 
 if __name__ == "__main__":
-    import asyncio
-
-    asyncio.run(main())
+    anyio.run(
+        main, backend="asyncio", backend_options={"use_uvloop": UVLOOP_AVAILABLE}
+    )
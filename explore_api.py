@@ -5,27 +5,28 @@ Script to explore elabFTW API endpoints and discover booking functionality.
 This helps identify what endpoints are available for implementing new features.
 """
 
-import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
-from dotenv import load_dotenv
 
-load_dotenv()
+from _config import (
+    API_BASE_URL,
+    API_KEY,
+    MAX_CONCURRENCY,
+    VERIFY_SSL,
+    load_json,
+    make_client,
+)
 
-API_BASE_URL = os.getenv("ELABFTW_API_URL", "https://your-server.example.com/api/v2")
-API_KEY = os.getenv("ELABFTW_API_KEY", "")
-VERIFY_SSL = os.getenv("ELABFTW_VERIFY_SSL", "false").lower() == "true"
+# Item field names that hint at booking/scheduling support
+BOOKING_FIELD_RE = re.compile(r"book|schedul|reserv|event|calendar", re.IGNORECASE)
 
-headers = {
-    "Authorization": API_KEY,
-    "Content-Type": "application/json",
-}
 
-
-def explore_endpoint(
+def probe_endpoint(
     client: httpx.Client, endpoint: str, method: str = "GET", params: dict = None
-):
-    """Try an endpoint and report what we find."""
+) -> str:
+    """Try an endpoint and return a report of what we find."""
     try:
         url = f"{API_BASE_URL}/{endpoint}"
         if method == "GET":
@@ -35,32 +36,38 @@ def explore_endpoint(
 
         response.raise_for_status()
 
-        print(f"\n✓ {method} /{endpoint}")
-        print(f"  Status: {response.status_code}")
+        lines = [f"\n✓ {method} /{endpoint}", f"  Status: {response.status_code}"]
 
         if response.headers.get("content-type", "").startswith("application/json"):
-            data = response.json()
+            data = load_json(response)
             if isinstance(data, list):
-                print(f"  Returns: List with {len(data)} items")
+                lines.append(f"  Returns: List with {len(data)} items")
                 if len(data) > 0:
-                    print(f"  First item keys: {list(data[0].keys())}")
+                    lines.append(f"  First item keys: {list(data[0].keys())}")
             elif isinstance(data, dict):
-                print(f"  Returns: Dict with keys: {list(data.keys())}")
+                lines.append(f"  Returns: Dict with keys: {list(data.keys())}")
 
-        return True
+        return "\n".join(lines)
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
-            print(f"\n✗ {method} /{endpoint} - Not Found (404)")
+            return f"\n✗ {method} /{endpoint} - Not Found (404)"
         elif e.response.status_code == 403:
-            print(
-                f"\n⚠ {method} /{endpoint} - Forbidden (403) - Might exist but need permissions"
-            )
+            return f"\n⚠ {method} /{endpoint} - Forbidden (403) - Might exist but need permissions"
         else:
-            print(f"\n✗ {method} /{endpoint} - Error {e.response.status_code}")
-        return False
+            return f"\n✗ {method} /{endpoint} - Error {e.response.status_code}"
     except Exception as e:
-        print(f"\n✗ {method} /{endpoint} - Error: {str(e)}")
-        return False
+        return f"\n✗ {method} /{endpoint} - Error: {str(e)}"
+
+
+def explore_endpoints(client: httpx.Client, endpoints: list, params: dict = None):
+    """Probe several endpoints concurrently and print the reports in order."""
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
+        reports = executor.map(
+            lambda endpoint: probe_endpoint(client, endpoint, params=params),
+            endpoints,
+        )
+        for report in reports:
+            print(report)
 
 
 def main():
@@ -74,14 +81,15 @@ def main():
     print(f"SSL Verification: {VERIFY_SSL}")
     print("=" * 60)
 
-    with httpx.Client(headers=headers, verify=VERIFY_SSL, timeout=30.0) as client:
+    with make_client() as client:
         # Known working endpoints (for reference)
         print("\n### KNOWN WORKING ENDPOINTS ###")
-        explore_endpoint(client, "experiments", params={"limit": 1})
-        explore_endpoint(client, "items", params={"limit": 1})
-        explore_endpoint(client, "experiments_templates", params={"limit": 1})
-        explore_endpoint(client, "teams/1/experiments_categories")
-        explore_endpoint(client, "teams/1/items_types")
+        explore_endpoints(
+            client, ["experiments", "items", "experiments_templates"], {"limit": 1}
+        )
+        explore_endpoints(
+            client, ["teams/1/experiments_categories", "teams/1/items_types"]
+        )
 
         # Potential booking-related endpoints
         print("\n\n### EXPLORING BOOKING-RELATED ENDPOINTS ###")
@@ -97,8 +105,7 @@ def main():
             "experiments_bookings",
         ]
 
-        for endpoint in booking_endpoints:
-            explore_endpoint(client, endpoint, params={"limit": 1})
+        explore_endpoints(client, booking_endpoints, params={"limit": 1})
 
         # Check if items have booking info
         print("\n\n### CHECKING ITEM STRUCTURE FOR BOOKING DATA ###")
@@ -106,30 +113,19 @@ def main():
             # Get first item to see its structure
             response = client.get(f"{API_BASE_URL}/items", params={"limit": 1})
             if response.status_code == 200:
-                items = response.json()
+                items = load_json(response)
                 if items and len(items) > 0:
                     item_id = items[0]["id"]
                     # Get full item details
                     item_response = client.get(f"{API_BASE_URL}/items/{item_id}")
                     if item_response.status_code == 200:
-                        item = item_response.json()
+                        item = load_json(item_response)
                         print(f"\nFull item {item_id} structure:")
                         print(f"Keys: {list(item.keys())}")
 
                         # Look for booking-related fields
                         booking_fields = [
-                            k
-                            for k in item.keys()
-                            if any(
-                                term in k.lower()
-                                for term in [
-                                    "book",
-                                    "schedul",
-                                    "reserv",
-                                    "event",
-                                    "calendar",
-                                ]
-                            )
+                            k for k in item if BOOKING_FIELD_RE.search(k)
                         ]
                         if booking_fields:
                             print(f"Booking-related fields found: {booking_fields}")
@@ -148,8 +144,7 @@ def main():
             "teams/1/events",
         ]
 
-        for endpoint in team_endpoints:
-            explore_endpoint(client, endpoint)
+        explore_endpoints(client, team_endpoints)
 
         # Try with a specific item (if bookable items exist)
         print("\n\n### CHECKING ITEM-SPECIFIC BOOKING ENDPOINTS ###")
@@ -159,23 +154,27 @@ def main():
                 f"{API_BASE_URL}/items", params={"q": "setup", "limit": 5}
             )
             if response.status_code == 200:
-                items = response.json()
+                items = load_json(response)
                 if items and len(items) > 0:
                     for item in items[:2]:  # Check first 2 items
                         item_id = item["id"]
                         print(
                             f"\nTrying booking endpoints for item {item_id} ({item.get('title', 'untitled')}):"
                         )
-                        explore_endpoint(client, f"items/{item_id}/bookings")
-                        explore_endpoint(client, f"items/{item_id}/schedule")
-                        explore_endpoint(client, f"items/{item_id}/events")
+                        explore_endpoints(
+                            client,
+                            [
+                                f"items/{item_id}/bookings",
+                                f"items/{item_id}/schedule",
+                                f"items/{item_id}/events",
+                            ],
+                        )
         except Exception as e:
             print(f"Error exploring item-specific endpoints: {e}")
 
         # Check API info endpoint
         print("\n\n### CHECKING API INFO ###")
-        explore_endpoint(client, "info")
-        explore_endpoint(client, "")  # Root endpoint
+        explore_endpoints(client, ["info", ""])  # "" is the root endpoint
 
     print("\n\n" + "=" * 60)
     print("Exploration complete!")